@@ -0,0 +1,77 @@
+"""Concurrent request pool for batch generation."""
+
+import asyncio
+import time
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+
+
+class RateLimiter:
+    """Async limiter admitting at most `rate` calls per `period` seconds.
+
+    Spaces admissions evenly instead of letting a burst of requests
+    hit the provider's per-minute quota in the first second.
+    """
+
+    def __init__(self, rate: int, period: float = 60.0):
+        self.interval = period / rate
+        self._next_slot = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until the next request slot is available."""
+        async with self._lock:
+            now = time.monotonic()
+            wait = self._next_slot - now
+            self._next_slot = max(now, self._next_slot) + self.interval
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+async def run_batch(
+    items: Sequence[Any],
+    process: Callable[[Any], Any],
+    concurrency: int = 8,
+    rpm: Optional[int] = None,
+) -> List[Tuple[Any, Any]]:
+    """
+    Run a blocking per-item function over items with bounded concurrency.
+
+    The pipeline's dominant cost is the network-bound LLM call, so
+    fanning files out through a pool turns N sequential latencies into
+    roughly ceil(N / concurrency) of them.
+
+    Args:
+        items: Inputs to process (typically file paths).
+        process: Blocking function applied to each item; runs on a
+            worker thread via asyncio.to_thread.
+        concurrency: Maximum number of items in flight at once.
+        rpm: Optional requests-per-minute ceiling shared by all workers.
+
+    Returns:
+        List of (item, result) pairs in input order; a failed item's
+        result is the exception it raised.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    limiter = RateLimiter(rpm) if rpm else None
+
+    async def run_one(item: Any) -> Any:
+        async with semaphore:
+            if limiter is not None:
+                await limiter.acquire()
+            return await asyncio.to_thread(process, item)
+
+    results = await asyncio.gather(
+        *[run_one(item) for item in items],
+        return_exceptions=True,
+    )
+    return list(zip(items, results))
+
+
+def run_batch_sync(
+    items: Sequence[Any],
+    process: Callable[[Any], Any],
+    concurrency: int = 8,
+    rpm: Optional[int] = None,
+) -> List[Tuple[Any, Any]]:
+    """Synchronous entry point for run_batch."""
+    return asyncio.run(run_batch(items, process, concurrency=concurrency, rpm=rpm))
@@ -0,0 +1,95 @@
+"""Disk-backed cache for LLM responses."""
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# One JSON file per entry, keyed by prompt hash; overridable for tests
+# and shared batch machines
+CACHE_DIR = Path(os.environ.get('PPTGEN_CACHE_DIR', str(Path.home() / '.cache' / 'pptgen')))
+
+
+def make_key(*parts: str) -> str:
+    """Build a stable cache key from the given strings."""
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part.encode('utf-8', errors='replace'))
+        digest.update(b'\x00')
+    return digest.hexdigest()
+
+
+def _entry_path(key: str) -> Path:
+    return CACHE_DIR / f"{key}.json"
+
+
+def lookup(key: str, max_age: Optional[float] = None) -> Optional[dict]:
+    """
+    Return the cached value for key, or None.
+
+    Args:
+        key: Cache key from make_key.
+        max_age: Optional maximum entry age in seconds; older entries
+            are treated as misses.
+    """
+    path = _entry_path(key)
+
+    try:
+        with open(path, 'rb') as f:
+            raw = f.read()
+        entry = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    except (OSError, ValueError):
+        return None
+
+    if max_age is not None and time.time() - entry.get('time', 0) > max_age:
+        return None
+
+    return entry.get('data')
+
+
+def store(key: str, data: dict) -> None:
+    """Store data under key; cache failures are never fatal."""
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        path = _entry_path(key)
+
+        entry = {'time': time.time(), 'data': data}
+        if orjson is not None:
+            raw = orjson.dumps(entry, option=orjson.OPT_NON_STR_KEYS)
+        else:
+            raw = json.dumps(entry).encode('utf-8')
+
+        # Write-then-rename so concurrent readers never see a partial
+        # entry
+        tmp_path = path.with_suffix('.tmp')
+        with open(tmp_path, 'wb') as f:
+            f.write(raw)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
+
+
+def clear() -> int:
+    """Delete all cache entries; returns the number removed."""
+    removed = 0
+
+    try:
+        entries = list(CACHE_DIR.glob('*.json'))
+    except OSError:
+        return 0
+
+    for path in entries:
+        try:
+            path.unlink()
+            removed += 1
+        except OSError:
+            continue
+
+    return removed
@@ -6,10 +6,77 @@ from pptx.util import Inches, Pt
 from pptx.enum.chart import XL_CHART_TYPE, XL_LEGEND_POSITION
 from pptx.chart.data import CategoryChartData
 
+# Characters a numeric CSV cell can start with; used to skip float() on
+# obviously non-numeric cells without paying for an exception
+_NUM_PREFIX = frozenset('-+0123456789.')
+
+
+def _nan_float(cell: str) -> float:
+    """Parse one CSV cell, mapping anything unparseable to NaN."""
+    try:
+        return float(cell)
+    except ValueError:
+        return float('nan')
+
+# Default chart geometries converted to EMU once at import time so the
+# factories skip four Inches() conversions per slide in the common case
+_BAR_LINE_DEFAULT = (1.0, 2.0, 8.0, 4.5)
+_BAR_LINE_DEFAULT_EMU = tuple(Inches(v) for v in _BAR_LINE_DEFAULT)
+_PIE_DEFAULT = (2.0, 2.0, 6.0, 4.5)
+_PIE_DEFAULT_EMU = tuple(Inches(v) for v in _PIE_DEFAULT)
+
+
+def _build_chart_data(categories, data) -> CategoryChartData:
+    """Build a CategoryChartData from any mapping of series to values.
+
+    Categories and series values are frozen to tuples once, so
+    add_series iterates plain tuples regardless of what the caller
+    passed in.
+    """
+    chart_data = CategoryChartData()
+    chart_data.categories = tuple(categories)
+
+    for series_name, values in data.items():
+        chart_data.add_series(series_name, tuple(values))
+
+    return chart_data
+
 
 class ChartGenerator:
     """Generate charts from data for PowerPoint presentations."""
-    
+
+    @staticmethod
+    def _create_categorical_chart(
+        slide,
+        chart_enum,
+        data,
+        categories,
+        title,
+        left,
+        top,
+        width,
+        height
+    ):
+        """Shared body of the bar and line factories."""
+        chart_data = _build_chart_data(categories, data)
+
+        if (left, top, width, height) == _BAR_LINE_DEFAULT:
+            x, y, cx, cy = _BAR_LINE_DEFAULT_EMU
+        else:
+            x, y, cx, cy = Inches(left), Inches(top), Inches(width), Inches(height)
+        chart = slide.shapes.add_chart(
+            chart_enum, x, y, cx, cy, chart_data
+        ).chart
+
+        if title:
+            chart.has_title = True
+            chart.chart_title.text_frame.text = title
+
+        chart.has_legend = True
+        chart.legend.position = XL_LEGEND_POSITION.BOTTOM
+
+        return chart
+
     @staticmethod
     def create_bar_chart(
         slide,
@@ -31,25 +98,10 @@ class ChartGenerator:
             title: Chart title
             left, top, width, height: Chart position and size in inches
         """
-        chart_data = CategoryChartData()
-        chart_data.categories = categories
-        
-        for series_name, values in data.items():
-            chart_data.add_series(series_name, values)
-        
-        x, y, cx, cy = Inches(left), Inches(top), Inches(width), Inches(height)
-        chart = slide.shapes.add_chart(
-            XL_CHART_TYPE.COLUMN_CLUSTERED, x, y, cx, cy, chart_data
-        ).chart
-        
-        if title:
-            chart.has_title = True
-            chart.chart_title.text_frame.text = title
-        
-        chart.has_legend = True
-        chart.legend.position = XL_LEGEND_POSITION.BOTTOM
-        
-        return chart
+        return ChartGenerator._create_categorical_chart(
+            slide, XL_CHART_TYPE.COLUMN_CLUSTERED,
+            data, categories, title, left, top, width, height
+        )
     
     @staticmethod
     def create_line_chart(
@@ -72,25 +124,10 @@ class ChartGenerator:
             title: Chart title
             left, top, width, height: Chart position and size in inches
         """
-        chart_data = CategoryChartData()
-        chart_data.categories = categories
-        
-        for series_name, values in data.items():
-            chart_data.add_series(series_name, values)
-        
-        x, y, cx, cy = Inches(left), Inches(top), Inches(width), Inches(height)
-        chart = slide.shapes.add_chart(
-            XL_CHART_TYPE.LINE, x, y, cx, cy, chart_data
-        ).chart
-        
-        if title:
-            chart.has_title = True
-            chart.chart_title.text_frame.text = title
-        
-        chart.has_legend = True
-        chart.legend.position = XL_LEGEND_POSITION.BOTTOM
-        
-        return chart
+        return ChartGenerator._create_categorical_chart(
+            slide, XL_CHART_TYPE.LINE,
+            data, categories, title, left, top, width, height
+        )
     
     @staticmethod
     def create_pie_chart(
@@ -111,11 +148,12 @@ class ChartGenerator:
             title: Chart title
             left, top, width, height: Chart position and size in inches
         """
-        chart_data = CategoryChartData()
-        chart_data.categories = list(data.keys())
-        chart_data.add_series('Values', list(data.values()))
-        
-        x, y, cx, cy = Inches(left), Inches(top), Inches(width), Inches(height)
+        chart_data = _build_chart_data(data.keys(), {'Values': data.values()})
+
+        if (left, top, width, height) == _PIE_DEFAULT:
+            x, y, cx, cy = _PIE_DEFAULT_EMU
+        else:
+            x, y, cx, cy = Inches(left), Inches(top), Inches(width), Inches(height)
         chart = slide.shapes.add_chart(
             XL_CHART_TYPE.PIE, x, y, cx, cy, chart_data
         ).chart
@@ -143,36 +181,88 @@ class ChartGenerator:
         """
         import csv
         import io
-        
+        from itertools import islice
+
+        # Bulk numeric conversion only pays off once there are enough
+        # rows to amortize numpy startup; tiny charts keep the pure
+        # Python path
+        np = None
+        if max_rows >= 64:
+            try:
+                import numpy as np
+            except ImportError:
+                pass
+
         try:
             reader = csv.reader(io.StringIO(csv_content))
-            rows = list(reader)
-            
-            if len(rows) < 2:
-                return None
-            
+
             # First row is headers
-            headers = rows[0]
-            
+            headers = next(reader, None)
+            if not headers:
+                return None
+
+            if np is not None:
+                rows = [row for row in islice(reader, max_rows) if len(row) >= 2]
+                if not rows:
+                    return None
+
+                categories = [row[0] for row in rows]
+                data = {}
+
+                # Convert each column in one vectorized cast; if any
+                # cell is unparseable the column retries per cell so a
+                # bad value zeroes only itself, matching the scalar
+                # fallback below
+                for i, header in enumerate(headers[1:], start=1):
+                    column = [
+                        row[i].strip() or 'nan' if i < len(row) else 'nan'
+                        for row in rows
+                    ]
+                    try:
+                        arr = np.array(column, dtype=np.float64)
+                    except ValueError:
+                        arr = np.array([_nan_float(c) for c in column], dtype=np.float64)
+                    data[header] = np.nan_to_num(np.atleast_1d(arr)).tolist()
+
+                return categories, data
+
             # First column is categories
             categories = []
             data = {header: [] for header in headers[1:]}
-            
-            for row in rows[1:max_rows + 1]:
+
+            # Bind (column index, append method) pairs once so the inner
+            # loop avoids repeated dict lookups per cell
+            appends = [(i, data[header].append) for i, header in enumerate(headers[1:], start=1)]
+
+            _float = float
+
+            # Only pull max_rows data rows off the reader instead of
+            # materializing the whole file
+            for row in islice(reader, max_rows):
                 if len(row) < 2:
                     continue
-                
+
                 categories.append(row[0])
-                
-                for i, header in enumerate(headers[1:], start=1):
-                    try:
-                        value = float(row[i]) if i < len(row) else 0.0
-                        data[header].append(value)
-                    except (ValueError, IndexError):
-                        data[header].append(0.0)
-            
+                row_len = len(row)
+
+                for i, append in appends:
+                    cell = row[i] if i < row_len else ''
+                    # Cheap prefix check so empty/text cells don't pay
+                    # for a raised ValueError
+                    if cell and cell[0] in _NUM_PREFIX:
+                        try:
+                            value = _float(cell)
+                        except ValueError:
+                            value = 0.0
+                    else:
+                        value = 0.0
+                    append(value)
+
+            if not categories:
+                return None
+
             return categories, data
-            
+
         except Exception:
             return None
     
@@ -187,16 +277,17 @@ class ChartGenerator:
         Returns:
             Chart type: 'bar', 'line', or 'pie'
         """
+        num_series = len(data)
+
         # If single series, prefer pie chart for small datasets
-        if len(data) == 1:
-            values = list(data.values())[0]
-            if len(values) <= 5:
-                return 'pie'
-        
+        if num_series == 1:
+            values = next(iter(data.values()))
+            return 'pie' if len(values) <= 5 else 'bar'
+
         # For multiple series or time-based data, use line chart
-        if len(data) > 1:
+        if num_series > 1:
             return 'line'
-        
+
         # Default to bar chart
         return 'bar'
 
@@ -217,8 +308,10 @@ def add_chart_slide(
     from pptx.util import Pt
     from pptx.enum.text import PP_ALIGN
     from pptx.dml.color import RGBColor
+
+    from pptx_generator import get_layout
     
-    slide = presentation.slides.add_slide(presentation.slide_layouts[5])  # Blank layout
+    slide = presentation.slides.add_slide(get_layout(presentation, 5))  # Blank layout
     
     # Add title
     title_shape = slide.shapes.title
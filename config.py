@@ -1,6 +1,7 @@
 """Configuration settings for the PowerPoint generator."""
 
 import os
+from types import MappingProxyType
 from typing import Dict, Any
 
 # Application metadata
@@ -18,6 +19,7 @@ DEEPSEEK_MODEL = "deepseek-chat"
 # LLM Settings
 MAX_TOKENS = 8192
 MAX_INPUT_CHARS = 50000  # Maximum characters to send to LLM
+MAX_INPUT_TOKENS = 12500  # Token equivalent of the above (~4 chars/token), used when tiktoken is installed
 RETRY_ATTEMPTS = 3
 RETRY_DELAY = 2  # seconds
 
@@ -160,6 +162,17 @@ THEMES: Dict[str, Dict[str, Any]] = {
     },
 }
 
+# Freeze the theme tables: hot styling paths read these on every
+# paragraph, and read-only proxies guarantee nothing mutates the shared
+# configuration mid-generation
+COLOR_SCHEMES = MappingProxyType({
+    name: MappingProxyType(scheme) for name, scheme in COLOR_SCHEMES.items()
+})
+THEMES = MappingProxyType({
+    name: MappingProxyType({**theme, 'colors': COLOR_SCHEMES[name]})
+    for name, theme in THEMES.items()
+})
+
 # Slide layout configurations
 SLIDE_LAYOUTS = {
     'title': 0,
@@ -188,3 +201,5 @@ EXPORT_FORMATS = ['pdf', 'html']  # Available export formats
 
 # Batch processing
 MAX_BATCH_FILES = 50  # Maximum files in batch mode
+BATCH_LLM_GROUP_SIZE = 8  # Documents packed into one LLM call in batch mode
+BATCH_LLM_SMALL_FILE_BYTES = 16000  # Only files up to this size are packed together
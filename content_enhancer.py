@@ -1,13 +1,58 @@
 """Enhanced content generation features for presentations."""
 
+import re
 from typing import List, Dict, Any, Optional
 from pptx.util import Pt, Inches
 from pptx.dml.color import RGBColor
 from pptx.enum.text import PP_ALIGN, MSO_AUTO_SIZE
-from pygments import highlight
-from pygments.lexers import get_lexer_by_name, guess_lexer
-from pygments.formatters import HtmlFormatter
-from pygments.util import ClassNotFound
+from functools import lru_cache
+
+from pptx_generator import get_layout
+
+# Font sizes and textbox geometry used on every enhanced slide,
+# converted to EMU once at import time
+_PT12 = Pt(12)
+_PT14 = Pt(14)
+_PT24 = Pt(24)
+_PT36 = Pt(36)
+_PT44 = Pt(44)
+_TITLE_BOX = (Inches(0.5), Inches(0.3), Inches(12.3), Inches(0.8))
+_BODY_BOX = (Inches(0.5), Inches(1.3), Inches(12.3), Inches(5.5))
+_TABLE_BOX = (Inches(0.5), Inches(1.5), Inches(12.3), Inches(5.0))
+
+# Keyword/character sets for detect_content_type; set intersection and
+# disjoint checks replace repeated substring scans per slide
+_CODE_KEYWORDS = frozenset({'code', 'implementation', 'example', 'snippet', 'function'})
+_TABLE_KEYWORDS = frozenset({'table', 'data', 'comparison', 'results', 'statistics'})
+_CODE_CHARS = frozenset('{}();=')
+
+
+@lru_cache(maxsize=256)
+def _rgb(rgb_tuple: tuple) -> RGBColor:
+    """Build an RGBColor once per distinct tuple and reuse it."""
+    return RGBColor(*rgb_tuple)
+
+
+@lru_cache(maxsize=32)
+def _fence_pattern(language: str):
+    """Compile the markdown code-fence regex once per language."""
+    return re.compile(r'```(?:' + re.escape(language) + r')?\s*\n(.*?)\n```', re.DOTALL)
+
+
+@lru_cache(maxsize=64)
+def _get_lexer(language: str):
+    """Resolve a Pygments lexer by language, caching across slides.
+
+    Pygments is only imported here, on the first cache miss, so decks
+    without code slides never pay its import cost.
+    """
+    from pygments.lexers import get_lexer_by_name
+    from pygments.util import ClassNotFound
+
+    try:
+        return get_lexer_by_name(language)
+    except ClassNotFound:
+        return None
 
 
 def create_code_slide(
@@ -27,26 +72,25 @@ def create_code_slide(
         language: Programming language for syntax highlighting
         theme: Theme configuration
     """
-    slide = prs.slides.add_slide(prs.slide_layouts[5])  # Blank layout
+    slide = prs.slides.add_slide(get_layout(prs, 5))  # Blank layout
     colors = theme['colors']
-    
+
+    # Resolve the lexer through the cache (None for unknown languages)
+    _get_lexer(language)
+
     # Add title
-    title_shape = slide.shapes.add_textbox(
-        Inches(0.5), Inches(0.3), Inches(12.3), Inches(0.8)
-    )
+    title_shape = slide.shapes.add_textbox(*_TITLE_BOX)
     title_frame = title_shape.text_frame
     title_frame.text = title
     title_para = title_frame.paragraphs[0]
     title_para.font.name = theme['font_title']
-    title_para.font.size = Pt(36)
-    title_para.font.color.rgb = RGBColor(*colors['primary'])
+    title_para.font.size = _PT36
+    title_para.font.color.rgb = _rgb(colors['primary'])
     title_para.font.bold = True
     title_para.alignment = PP_ALIGN.LEFT
     
     # Add code box
-    code_shape = slide.shapes.add_textbox(
-        Inches(0.5), Inches(1.3), Inches(12.3), Inches(5.5)
-    )
+    code_shape = slide.shapes.add_textbox(*_BODY_BOX)
     code_frame = code_shape.text_frame
     code_frame.word_wrap = True
     code_frame.auto_size = MSO_AUTO_SIZE.NONE
@@ -55,13 +99,13 @@ def create_code_slide(
     code_para = code_frame.paragraphs[0]
     code_para.text = code
     code_para.font.name = "Consolas"
-    code_para.font.size = Pt(14)
-    code_para.font.color.rgb = RGBColor(40, 40, 40)
+    code_para.font.size = _PT14
+    code_para.font.color.rgb = _rgb((40, 40, 40))
     
     # Add background color
     fill = code_shape.fill
     fill.solid()
-    fill.fore_color.rgb = RGBColor(245, 245, 245)
+    fill.fore_color.rgb = _rgb((245, 245, 245))
 
 
 def create_table_slide(
@@ -83,72 +127,86 @@ def create_table_slide(
         theme: Theme configuration
         max_rows: Maximum rows to display
     """
-    from pptx.oxml.xmlchemy import OxmlElement
-    
-    slide = prs.slides.add_slide(prs.slide_layouts[5])  # Blank layout
+    from xml.sax.saxutils import escape
+
+    from pptx.oxml import parse_xml
+    from pptx.oxml.ns import nsdecls, qn
+
+    slide = prs.slides.add_slide(get_layout(prs, 5))  # Blank layout
     colors = theme['colors']
-    
+
     # Add title
-    title_shape = slide.shapes.add_textbox(
-        Inches(0.5), Inches(0.3), Inches(12.3), Inches(0.8)
-    )
+    title_shape = slide.shapes.add_textbox(*_TITLE_BOX)
     title_frame = title_shape.text_frame
     title_frame.text = title
     title_para = title_frame.paragraphs[0]
     title_para.font.name = theme['font_title']
-    title_para.font.size = Pt(36)
-    title_para.font.color.rgb = RGBColor(*colors['primary'])
+    title_para.font.size = _PT36
+    title_para.font.color.rgb = _rgb(colors['primary'])
     title_para.font.bold = True
-    
+
     # Limit rows
     display_rows = rows[:max_rows]
-    
+
     # Calculate dimensions
     num_cols = len(headers)
     num_rows = len(display_rows) + 1  # +1 for header
-    
-    # Add table
+
+    # Add table (python-pptx builds the frame, grid and empty rows)
     table_shape = slide.shapes.add_table(
         rows=num_rows,
         cols=num_cols,
-        left=Inches(0.5),
-        top=Inches(1.5),
-        width=Inches(12.3),
-        height=Inches(5.0)
+        left=_TABLE_BOX[0],
+        top=_TABLE_BOX[1],
+        width=_TABLE_BOX[2],
+        height=_TABLE_BOX[3]
     )
-    
-    table = table_shape.table
-    
-    # Set header row
-    for col_idx, header in enumerate(headers):
-        cell = table.cell(0, col_idx)
-        cell.text = header
-        cell.fill.solid()
-        cell.fill.fore_color.rgb = RGBColor(*colors['primary'])
-        
-        # Header text formatting
-        para = cell.text_frame.paragraphs[0]
-        para.font.size = Pt(14)
-        para.font.bold = True
-        para.font.color.rgb = RGBColor(255, 255, 255)
-        para.alignment = PP_ALIGN.CENTER
-    
-    # Set data rows
+
+    # Rebuild the rows with one XML parse per row instead of walking
+    # python-pptx's cell/fill/font proxies for every cell; each proxy
+    # assignment is several lxml mutations, so big tables pay hundreds
+    # of DOM operations the direct markup avoids
+    tbl = table_shape.table._tbl
+    row_height = tbl.find(qn('a:tr')).get('h')
+    a = nsdecls('a')
+
+    primary_hex = '%02X%02X%02X' % tuple(colors['primary'])
+    text_hex = '%02X%02X%02X' % tuple(colors['text'])
+
+    def _tc(text, size, color_hex, bold, align, fill_hex=None):
+        fill = f'<a:solidFill><a:srgbClr val="{fill_hex}"/></a:solidFill>' if fill_hex else ''
+        return (
+            f'<a:tc><a:txBody><a:bodyPr/><a:lstStyle/>'
+            f'<a:p><a:pPr algn="{align}"/>'
+            f'<a:r><a:rPr lang="en-US" sz="{size}" b="{bold}">'
+            f'<a:solidFill><a:srgbClr val="{color_hex}"/></a:solidFill></a:rPr>'
+            f'<a:t>{escape(text)}</a:t></a:r></a:p></a:txBody>'
+            f'<a:tcPr>{fill}</a:tcPr></a:tc>'
+        )
+
+    new_rows = []
+
+    # Header row: bold white text on the primary color
+    header_cells = ''.join(
+        _tc(header, 1400, 'FFFFFF', 1, 'ctr', primary_hex) for header in headers
+    )
+    new_rows.append(parse_xml(f'<a:tr {a} h="{row_height}">{header_cells}</a:tr>'))
+
+    # Data rows with alternate shading on even rows
     for row_idx, row_data in enumerate(display_rows, start=1):
-        for col_idx, cell_data in enumerate(row_data):
-            cell = table.cell(row_idx, col_idx)
-            cell.text = str(cell_data)
-            
-            # Alternate row colors
-            if row_idx % 2 == 0:
-                cell.fill.solid()
-                cell.fill.fore_color.rgb = RGBColor(240, 240, 240)
-            
-            # Cell text formatting
-            para = cell.text_frame.paragraphs[0]
-            para.font.size = Pt(12)
-            para.font.color.rgb = RGBColor(*colors['text'])
-            para.alignment = PP_ALIGN.LEFT
+        fill_hex = 'F0F0F0' if row_idx % 2 == 0 else None
+        cells = [
+            _tc(str(cell_data), 1200, text_hex, 0, 'l', fill_hex)
+            for cell_data in row_data
+        ]
+        # Pad short rows so the grid stays rectangular
+        cells.extend(_tc('', 1200, text_hex, 0, 'l', fill_hex) for _ in range(num_cols - len(cells)))
+        new_rows.append(parse_xml(f'<a:tr {a} h="{row_height}">{"".join(cells[:num_cols])}</a:tr>'))
+
+    for tr in tbl.findall(qn('a:tr')):
+        tbl.remove(tr)
+    for tr in new_rows:
+        tbl.append(tr)
 
 
 def create_agenda_slide(
@@ -164,7 +222,7 @@ def create_agenda_slide(
         sections: List of section titles
         theme: Theme configuration
     """
-    slide = prs.slides.add_slide(prs.slide_layouts[1])  # Title and Content
+    slide = prs.slides.add_slide(get_layout(prs, 1))  # Title and Content
     colors = theme['colors']
     
     # Set title
@@ -172,8 +230,8 @@ def create_agenda_slide(
     title_shape.text = "Agenda"
     for para in title_shape.text_frame.paragraphs:
         para.font.name = theme['font_title']
-        para.font.size = Pt(44)
-        para.font.color.rgb = RGBColor(*colors['primary'])
+        para.font.size = _PT44
+        para.font.color.rgb = _rgb(colors['primary'])
         para.font.bold = True
         para.alignment = PP_ALIGN.CENTER
     
@@ -190,10 +248,10 @@ def create_agenda_slide(
         
         p.text = f"{i}. {section}"
         p.font.name = theme['font_body']
-        p.font.size = Pt(24)
-        p.font.color.rgb = RGBColor(*colors['text'])
-        p.space_before = Pt(12)
-        p.space_after = Pt(12)
+        p.font.size = _PT24
+        p.font.color.rgb = _rgb(colors['text'])
+        p.space_before = _PT12
+        p.space_after = _PT12
 
 
 def parse_code_from_content(content: str, language: str = "python") -> Optional[str]:
@@ -207,14 +265,10 @@ def parse_code_from_content(content: str, language: str = "python") -> Optional[
     Returns:
         Extracted code or None
     """
-    import re
-    
     # Look for markdown code blocks
-    pattern = r'```(?:' + language + r')?\s*\n(.*?)\n```'
-    matches = re.findall(pattern, content, re.DOTALL)
-    
-    if matches:
-        return matches[0]
+    match = _fence_pattern(language).search(content)
+    if match:
+        return match.group(1)
     
     # Look for indented code blocks
     lines = content.split('\n')
@@ -249,17 +303,21 @@ def parse_csv_to_table(csv_content: str, max_rows: int = 12) -> Optional[tuple]:
     """
     import csv
     import io
-    
+    from itertools import islice
+
     try:
         reader = csv.reader(io.StringIO(csv_content))
-        rows = list(reader)
-        
-        if len(rows) < 2:
+
+        # Pull only the header plus max_rows rows off the reader
+        # instead of materializing the whole file
+        headers = next(reader, None)
+        if not headers:
             return None
-        
-        headers = rows[0]
-        data_rows = rows[1:max_rows + 1]
-        
+
+        data_rows = list(islice(reader, max_rows))
+        if not data_rows:
+            return None
+
         return headers, data_rows
     except Exception:
         return None
@@ -277,17 +335,19 @@ def detect_content_type(slide_data: Dict[str, Any]) -> str:
     """
     title = slide_data.get('title', '').lower()
     content = slide_data.get('content', [])
-    
+
+    title_words = set(title.split())
+
     # Check title for code keywords
-    if any(keyword in title for keyword in ['code', 'implementation', 'example', 'snippet', 'function']):
+    if title_words & _CODE_KEYWORDS:
         # Check if content looks like code
         if content and isinstance(content, list):
             first_item = content[0] if content else ""
-            if any(char in first_item for char in ['{', '}', '(', ')', ';', '=']):
+            if not _CODE_CHARS.isdisjoint(first_item):
                 return 'code'
-    
+
     # Check title for table keywords
-    if any(keyword in title for keyword in ['table', 'data', 'comparison', 'results', 'statistics']):
+    if title_words & _TABLE_KEYWORDS:
         return 'table'
-    
+
     return 'normal'
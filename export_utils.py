@@ -1,9 +1,52 @@
 """Module for exporting presentations to different formats."""
 
+import html
 import os
 import subprocess
 from pathlib import Path
-from typing import Optional
+from typing import Final, Optional
+
+from pptx.oxml.ns import qn
+
+_A_BR = qn('a:br')
+
+# Static reveal.js wrapper, built once at import time; the CDN URLs
+# and CSS never vary per export
+_HTML_HEADER: Final[str] = """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Presentation</title>
+    <link rel="stylesheet" href="https://cdn.jsdelivr.net/npm/reveal.js@4.6.1/dist/reveal.min.css">
+    <link rel="stylesheet" href="https://cdn.jsdelivr.net/npm/reveal.js@4.6.1/dist/theme/white.css">
+    <style>
+        .reveal h1 { font-size: 2.5em; margin-bottom: 0.5em; }
+        .reveal h2 { font-size: 2em; margin-bottom: 0.5em; }
+        .reveal ul { text-align: left; }
+        .reveal li { margin: 0.5em 0; }
+    </style>
+</head>
+<body>
+    <div class="reveal">
+        <div class="slides">
+"""
+
+_HTML_FOOTER: Final[str] = """        </div>
+    </div>
+    <script src="https://cdn.jsdelivr.net/npm/reveal.js@4.6.1/dist/reveal.min.js"></script>
+    <script>
+        Reveal.initialize({
+            hash: true,
+            transition: 'slide',
+            controls: true,
+            progress: true,
+            center: true,
+        });
+    </script>
+</body>
+</html>
+"""
 
 
 class PresentationExporter:
@@ -24,38 +67,34 @@ class PresentationExporter:
         Note:
             Requires LibreOffice or Microsoft PowerPoint to be installed
         """
-        if pdf_path is None:
-            pdf_path = str(Path(pptx_path).with_suffix('.pdf'))
-        
+        # Parse the paths once and reuse the Path objects throughout
+        pptx_p = Path(pptx_path)
+        pdf_p = Path(pdf_path) if pdf_path else pptx_p.with_suffix('.pdf')
+        pdf_path = str(pdf_p)
+
         # Try LibreOffice first (cross-platform)
         try:
-            subprocess.run([
-                'soffice',
-                '--headless',
-                '--convert-to', 'pdf',
-                '--outdir', str(Path(pdf_path).parent),
-                pptx_path
-            ], check=True, capture_output=True)
-            
+            PresentationExporter.export_to_pdf_batch([pptx_path], str(pdf_p.parent))
+
             # LibreOffice outputs to same directory with .pdf extension
-            generated_pdf = str(Path(pptx_path).with_suffix('.pdf'))
-            if generated_pdf != pdf_path and Path(generated_pdf).exists():
-                os.rename(generated_pdf, pdf_path)
-            
+            generated_p = pptx_p.with_suffix('.pdf')
+            if str(generated_p) != pdf_path and generated_p.exists():
+                os.rename(str(generated_p), pdf_path)
+
             return pdf_path
         except (subprocess.CalledProcessError, FileNotFoundError):
             pass
-        
+
         # Try PowerPoint on Windows
         if os.name == 'nt':
             try:
                 import comtypes.client
-                
+
                 powerpoint = comtypes.client.CreateObject("Powerpoint.Application")
                 powerpoint.Visible = 1
-                
-                pptx_abs_path = str(Path(pptx_path).resolve())
-                pdf_abs_path = str(Path(pdf_path).resolve())
+
+                pptx_abs_path = str(pptx_p.resolve())
+                pdf_abs_path = str(pdf_p.resolve())
                 
                 presentation = powerpoint.Presentations.Open(pptx_abs_path)
                 presentation.SaveAs(pdf_abs_path, 32)  # 32 = PDF format
@@ -70,7 +109,29 @@ class PresentationExporter:
             "PDF export requires LibreOffice (soffice) or Microsoft PowerPoint. "
             "Install LibreOffice: https://www.libreoffice.org/download/"
         )
-    
+
+    @staticmethod
+    def export_to_pdf_batch(pptx_paths: list, outdir: str) -> None:
+        """
+        Convert several PPTX files to PDF with one LibreOffice invocation.
+
+        Args:
+            pptx_paths: Paths to the PPTX files to convert
+            outdir: Directory where the PDFs are written
+
+        Note:
+            LibreOffice startup dominates single-file conversion time, so
+            passing the whole batch in one command amortizes it across
+            all files.
+        """
+        subprocess.run([
+            'soffice',
+            '--headless',
+            '--convert-to', 'pdf',
+            '--outdir', outdir,
+            *pptx_paths
+        ], check=True, capture_output=True)
+
     @staticmethod
     def export_to_html(pptx_path: str, html_path: Optional[str] = None) -> str:
         """
@@ -90,67 +151,59 @@ class PresentationExporter:
         from pptx import Presentation
         
         prs = Presentation(pptx_path)
-        
-        html_content = """<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Presentation</title>
-    <link rel="stylesheet" href="https://cdn.jsdelivr.net/npm/reveal.js@4.6.1/dist/reveal.min.css">
-    <link rel="stylesheet" href="https://cdn.jsdelivr.net/npm/reveal.js@4.6.1/dist/theme/white.css">
-    <style>
-        .reveal h1 { font-size: 2.5em; margin-bottom: 0.5em; }
-        .reveal h2 { font-size: 2em; margin-bottom: 0.5em; }
-        .reveal ul { text-align: left; }
-        .reveal li { margin: 0.5em 0; }
-    </style>
-</head>
-<body>
-    <div class="reveal">
-        <div class="slides">
-"""
-        
-        for slide_num, slide in enumerate(prs.slides, start=1):
-            html_content += '            <section>\n'
-            
-            # Extract text from slide
-            for shape in slide.shapes:
-                if hasattr(shape, "text") and shape.text.strip():
-                    text = shape.text.strip()
-                    
+
+        # Stream slides straight to the file instead of growing one big
+        # string with repeated concatenation
+        with open(html_path, 'w', encoding='utf-8') as f:
+            _w = f.write
+            _w(_HTML_HEADER)
+
+            for slide_num, slide in enumerate(prs.slides, start=1):
+                _w('            <section>\n')
+
+                # Extract text with one XPath per shape instead of
+                # shape.text, which builds a python-pptx wrapper for
+                # every paragraph and run it touches. Only the shape's
+                # own text body counts — tables and charts in graphic
+                # frames carry their own txBody elements that must not
+                # leak into the slide text — and a:br line breaks
+                # become newlines so adjacent words stay separated
+                for shape in slide.shapes:
+                    element = getattr(shape, '_element', None)
+                    if element is None:
+                        continue
+                    tx_bodies = element.xpath('./p:txBody')
+                    if not tx_bodies:
+                        continue
+                    text = '\n'.join(
+                        ''.join(
+                            '\n' if node.tag == _A_BR else (node.text or '')
+                            for node in p.xpath('.//a:t | .//a:br')
+                        )
+                        for p in tx_bodies[0].xpath('./a:p')
+                    )
+                    text = text.strip()
+                    if not text:
+                        continue
+
                     # First text element as title
                     if slide_num == 1 or '\n' not in text:
-                        html_content += f'                <h2>{text}</h2>\n'
-                    else:
-                        # Multi-line text as list
-                        html_content += '                <ul>\n'
-                        for line in text.split('\n'):
-                            if line.strip():
-                                html_content += f'                    <li>{line.strip()}</li>\n'
-                        html_content += '                </ul>\n'
-            
-            html_content += '            </section>\n'
-        
-        html_content += """        </div>
-    </div>
-    <script src="https://cdn.jsdelivr.net/npm/reveal.js@4.6.1/dist/reveal.min.js"></script>
-    <script>
-        Reveal.initialize({
-            hash: true,
-            transition: 'slide',
-            controls: true,
-            progress: true,
-            center: true,
-        });
-    </script>
-</body>
-</html>
-"""
-        
-        with open(html_path, 'w', encoding='utf-8') as f:
-            f.write(html_content)
-        
+                        _w(f'                <h2>{html.escape(text)}</h2>\n')
+                        continue
+
+                    # Multi-line text as list, escaped and joined in
+                    # one pass
+                    lines_html = '\n'.join(
+                        f'                    <li>{html.escape(line.strip())}</li>'
+                        for line in text.split('\n')
+                        if line.strip()
+                    )
+                    _w(f'                <ul>\n{lines_html}\n                </ul>\n')
+
+                _w('            </section>\n')
+
+            _w(_HTML_FOOTER)
+
         return html_path
     
     @staticmethod
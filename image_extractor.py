@@ -1,6 +1,8 @@
 """Module for extracting images from PDF and DOCX files."""
 
 import io
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 from PIL import Image
@@ -9,12 +11,21 @@ from PIL import Image
 class ImageData:
     """Container for image data."""
     
-    def __init__(self, image: Image.Image, page_num: Optional[int] = None, description: str = ""):
+    def __init__(
+        self,
+        image: Image.Image,
+        page_num: Optional[int] = None,
+        description: str = "",
+        source_bytes: Optional[bytes] = None
+    ):
         """Initialize image data."""
         self.image = image
         self.page_num = page_num
         self.description = description
         self.width, self.height = image.size
+        # Original encoded blob, kept so size queries don't have to
+        # re-encode the decoded image
+        self.source_bytes = source_bytes
     
     def save(self, output_path: str) -> None:
         """Save image to file."""
@@ -43,71 +54,216 @@ def extract_images_from_pdf(file_path: str, max_images: int = 20) -> List[ImageD
     except ImportError:
         raise ImportError("pypdf package required for PDF image extraction")
     
-    images = []
-    
+    # Walking pypdf objects is cheap; collect decode tasks serially,
+    # then decode on a thread pool. PIL's JPEG/zlib decoders release
+    # the GIL, so the decodes genuinely run in parallel.
+    tasks = []
+
     try:
         reader = PdfReader(file_path)
-        
+
         for page_num, page in enumerate(reader.pages, start=1):
-            if len(images) >= max_images:
+            if len(tasks) >= max_images:
                 break
-            
-            if '/XObject' in page['/Resources']:
-                xobjects = page['/Resources']['/XObject'].get_object()
-                
-                for obj_name in xobjects:
+            _collect_page_image_tasks(page, page_num, tasks, max_images)
+
+    except Exception:
+        # A malformed page must not discard images already collected;
+        # decode whatever was gathered before the failure
+        pass
+
+    return _decode_image_tasks(tasks, max_images)
+
+
+def _jpeg_dims(data: bytes) -> Optional[tuple]:
+    """Read JPEG dimensions from the SOF marker without decoding.
+
+    Returns (width, height), or None if no frame header is found.
+    """
+    if not data.startswith(b'\xff\xd8'):
+        return None
+
+    pos = 2
+    end = len(data)
+
+    while pos + 9 < end:
+        if data[pos] != 0xFF:
+            return None
+        marker = data[pos + 1]
+        # SOF0-SOF15 excluding DHT/JPG/DAC (0xC4, 0xC8, 0xCC)
+        if 0xC0 <= marker <= 0xCF and marker not in (0xC4, 0xC8, 0xCC):
+            height = (data[pos + 5] << 8) | data[pos + 6]
+            width = (data[pos + 7] << 8) | data[pos + 8]
+            return width, height
+        # Standalone markers carry no length field
+        if 0xD0 <= marker <= 0xD9:
+            pos += 2
+            continue
+        pos += 2 + ((data[pos + 2] << 8) | data[pos + 3])
+
+    return None
+
+
+def _decode_pdf_image(task) -> Optional[ImageData]:
+    """Decode one collected PDF image stream; None if bad or tiny."""
+    page_num, filter_type, img_data, width, height, mode = task
+
+    try:
+        if filter_type == '/DCTDecode':  # JPEG
+            # Dimensions live in the frame header; reject icons
+            # before paying for a full decode
+            dims = _jpeg_dims(img_data)
+            if dims is not None and (dims[0] < 100 or dims[1] < 100):
+                return None
+            img = Image.open(io.BytesIO(img_data))
+        else:  # /FlateDecode (PNG-style raw stream)
+            img = Image.frombytes(mode, (width, height), img_data)
+    except Exception:
+        return None
+
+    # Filter out very small images (likely icons/logos)
+    if img.width < 100 or img.height < 100:
+        return None
+
+    return ImageData(
+        image=img,
+        page_num=page_num,
+        description=f"Image from page {page_num}",
+        source_bytes=img_data
+    )
+
+
+def extract_pdf_content(file_path: str, max_images: int = 20) -> tuple:
+    """
+    Extract text and images from a PDF in one pass.
+
+    Opens the document once and walks the pages once, instead of the
+    separate parses read_pdf_file and extract_images_from_pdf pay when
+    called back to back. Uses PyMuPDF when installed (C-level text and
+    image access), otherwise shares a single pypdf reader.
+
+    Args:
+        file_path: Path to the PDF file
+        max_images: Maximum number of images to extract
+
+    Returns:
+        Tuple of (text, list of ImageData)
+    """
+    try:
+        import fitz  # PyMuPDF
+    except ImportError:
+        fitz = None
+
+    if fitz is not None:
+        text_parts = []
+        images = []
+
+        with fitz.open(file_path) as doc:
+            for page_num, page in enumerate(doc, start=1):
+                page_text = page.get_text()
+                if page_text:
+                    text_parts.append(f"--- Page {page_num} ---\n{page_text}")
+
+                if len(images) >= max_images:
+                    continue
+
+                for img_info in page.get_images(full=True):
                     if len(images) >= max_images:
                         break
-                    
-                    obj = xobjects[obj_name]
-                    
-                    if obj['/Subtype'] == '/Image':
-                        try:
-                            # Get image data
-                            if '/Filter' in obj:
-                                filter_type = obj['/Filter']
-                                if filter_type == '/DCTDecode':  # JPEG
-                                    img_data = obj._data
-                                    img = Image.open(io.BytesIO(img_data))
-                                elif filter_type == '/FlateDecode':  # PNG
-                                    img_data = obj._data
-                                    width = obj['/Width']
-                                    height = obj['/Height']
-                                    
-                                    # Handle different color spaces
-                                    if '/ColorSpace' in obj:
-                                        color_space = obj['/ColorSpace']
-                                        if color_space == '/DeviceRGB':
-                                            mode = 'RGB'
-                                        elif color_space == '/DeviceGray':
-                                            mode = 'L'
-                                        else:
-                                            mode = 'RGB'
-                                    else:
-                                        mode = 'RGB'
-                                    
-                                    img = Image.frombytes(mode, (width, height), img_data)
-                                else:
-                                    continue
-                            else:
-                                continue
-                            
-                            # Filter out very small images (likely icons/logos)
-                            if img.width >= 100 and img.height >= 100:
-                                images.append(ImageData(
-                                    image=img,
-                                    page_num=page_num,
-                                    description=f"Image from page {page_num}"
-                                ))
-                        except Exception:
-                            # Skip problematic images
-                            continue
-    
-    except Exception as e:
-        # Return empty list if extraction fails
+                    try:
+                        blob = doc.extract_image(img_info[0])['image']
+                        img = Image.open(io.BytesIO(blob))
+                    except Exception:
+                        continue
+                    if img.width >= 100 and img.height >= 100:
+                        images.append(ImageData(
+                            image=img,
+                            page_num=page_num,
+                            description=f"Image from page {page_num}",
+                            source_bytes=blob
+                        ))
+
+        return '\n\n'.join(text_parts), images
+
+    # pypdf fallback: one reader serves both the text walk and the
+    # image-task collection
+    try:
+        from pypdf import PdfReader
+    except ImportError:
+        raise ImportError("pypdf package required for PDF extraction")
+
+    text_parts = []
+    tasks = []
+
+    try:
+        reader = PdfReader(file_path)
+
+        for page_num, page in enumerate(reader.pages, start=1):
+            page_text = page.extract_text()
+            if page_text:
+                text_parts.append(f"--- Page {page_num} ---\n{page_text}")
+
+            if len(tasks) < max_images:
+                _collect_page_image_tasks(page, page_num, tasks, max_images)
+    except Exception:
+        # Keep the text and image tasks gathered before the failure
         pass
-    
-    return images
+
+    return '\n\n'.join(text_parts), _decode_image_tasks(tasks, max_images)
+
+
+def _collect_page_image_tasks(page, page_num: int, tasks: list, max_images: int) -> None:
+    """Append decode tasks for a page's image XObjects to tasks."""
+    if '/XObject' not in page['/Resources']:
+        return
+
+    xobjects = page['/Resources']['/XObject'].get_object()
+
+    for obj_name in xobjects:
+        if len(tasks) >= max_images:
+            return
+
+        obj = xobjects[obj_name]
+
+        if obj['/Subtype'] == '/Image' and '/Filter' in obj:
+            filter_type = obj['/Filter']
+            if filter_type not in ('/DCTDecode', '/FlateDecode'):
+                continue
+
+            # Handle different color spaces
+            if '/ColorSpace' in obj and obj['/ColorSpace'] == '/DeviceGray':
+                mode = 'L'
+            else:
+                mode = 'RGB'
+
+            try:
+                width = obj['/Width']
+                height = obj['/Height']
+                # Small images (likely icons/logos) are rejected here
+                # so they don't count toward the max_images cap; for
+                # JPEGs the frame header is the authoritative size
+                if width < 100 or height < 100:
+                    continue
+                data = obj._data
+                if filter_type == '/DCTDecode':
+                    dims = _jpeg_dims(data)
+                    if dims is not None and (dims[0] < 100 or dims[1] < 100):
+                        continue
+                tasks.append((page_num, filter_type, data, width, height, mode))
+            except Exception:
+                # Skip problematic images
+                continue
+
+
+def _decode_image_tasks(tasks: list, max_images: int) -> List[ImageData]:
+    """Decode collected tasks on a thread pool, dropping failures."""
+    if not tasks:
+        return []
+
+    with ThreadPoolExecutor(max_workers=min(len(tasks), os.cpu_count() or 1)) as executor:
+        decoded = executor.map(_decode_pdf_image, tasks)
+
+    return [img for img in decoded if img is not None][:max_images]
 
 
 def extract_images_from_docx(file_path: str, max_images: int = 20) -> List[ImageData]:
@@ -145,7 +301,8 @@ def extract_images_from_docx(file_path: str, max_images: int = 20) -> List[Image
                     if img.width >= 100 and img.height >= 100:
                         images.append(ImageData(
                             image=img,
-                            description="Image from document"
+                            description="Image from document",
+                            source_bytes=img_data
                         ))
                 except Exception:
                     # Skip problematic images
@@ -201,8 +358,15 @@ def get_image_statistics(images: List[ImageData]) -> Dict[str, Any]:
     total_width = sum(img.width for img in images)
     total_height = sum(img.height for img in images)
     
-    # Estimate size in MB
-    total_size_mb = sum(len(img.to_bytes()) for img in images) / (1024 * 1024)
+    # Estimate size from the original blob when we still have it;
+    # otherwise from raw pixel dimensions. Either way no image is
+    # re-encoded just to be measured.
+    total_size = sum(
+        len(img.source_bytes) if img.source_bytes is not None
+        else img.width * img.height * len(img.image.getbands())
+        for img in images
+    )
+    total_size_mb = total_size / (1024 * 1024)
     
     return {
         'count': len(images),
@@ -1,16 +1,144 @@
 """Module for interacting with LLM APIs for presentation generation."""
 
 import json
-import re
+from functools import lru_cache
 from typing import Callable, Optional
 
-from config import MAX_INPUT_CHARS
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+import cache
+from config import MAX_INPUT_CHARS, MAX_INPUT_TOKENS
 from llm_providers import create_provider, LLMProvider
 
 
-def get_system_prompt() -> str:
-    """Return the system prompt for presentation generation."""
-    return """You are an expert presentation designer and content strategist. Your task is to analyze the provided content and create a comprehensive, rich PowerPoint presentation.
+def _strip_fences(text: str) -> str:
+    """Return the body of the first markdown code fence, if any.
+
+    partition stops at the first match and allocates two small
+    substrings, instead of regex-scanning (or split-listing) the
+    whole response. An unclosed trailing fence yields the remainder.
+    """
+    if '```' not in text:
+        return text
+
+    _, _, rest = text.partition('```')
+    if rest.startswith('json'):
+        rest = rest[4:]
+    body, _, _ = rest.partition('```')
+    return body.strip()
+
+
+if msgspec is not None:
+    # Typed decode is faster than JSON-to-dict on long slide lists
+    # and applies the title/slides defaults during parsing. The
+    # field set mirrors every slide key the generators read,
+    # including the comparison-slide columns.
+    class _Slide(msgspec.Struct):
+        title: str = 'Untitled Slide'
+        content: list = []
+        notes: str = ''
+        type: str = 'content'
+        left: list = []
+        right: list = []
+        left_title: str = ''
+        right_title: str = ''
+
+    class _Presentation(msgspec.Struct):
+        title: str = 'Generated Presentation'
+        slides: list[_Slide] = []
+
+    _PRESENTATION_DECODER = msgspec.json.Decoder(_Presentation)
+
+
+def _decode_presentation(text: str) -> Optional[dict]:
+    """Decode a response into the presentation dict via msgspec.
+
+    Returns None when msgspec is unavailable or the payload does not
+    match the schema; callers then take the generic json path. The
+    decoded struct is converted back to builtins so downstream code
+    keeps its plain-dict contract.
+    """
+    if msgspec is None:
+        return None
+    try:
+        return msgspec.to_builtins(_PRESENTATION_DECODER.decode(text))
+    except msgspec.DecodeError:
+        return None
+
+
+def _json_loads(text: str):
+    """Parse JSON with orjson when installed, stdlib json otherwise.
+
+    Long decks with detailed notes routinely exceed 50KB of JSON;
+    orjson parses those several times faster than the stdlib.
+    """
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def _find_json_object(text: str) -> Optional[str]:
+    """Return the first balanced {...} block in text, or None.
+
+    Single O(n) scan tracking brace depth and JSON string state;
+    avoids the backtracking a greedy regex pays on large responses.
+    """
+    start = text.find('{')
+    if start == -1:
+        return None
+
+    depth = 0
+    in_string = False
+    escaped = False
+
+    for i in range(start, len(text)):
+        ch = text[i]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif ch == '\\':
+                escaped = True
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            in_string = True
+        elif ch == '{':
+            depth += 1
+        elif ch == '}':
+            depth -= 1
+            if depth == 0:
+                return text[start:i + 1]
+
+    return None
+
+
+@lru_cache(maxsize=8)
+def _cached_provider(provider_name: str, kwargs_items: tuple) -> LLMProvider:
+    """Create (or reuse) a provider for the given name and kwargs.
+
+    Providers own HTTP clients with TCP/TLS connection pools, so
+    reusing one across calls keeps connections warm in batch runs.
+    """
+    return create_provider(provider_name, **dict(kwargs_items))
+
+
+# Built once at import; a single shared object also keeps the prompt
+# byte-identical across calls, which provider-side prompt caching
+# depends on
+SYSTEM_PROMPT = """You are an expert presentation designer and content strategist. Your task is to analyze the provided content and create a comprehensive, rich PowerPoint presentation.
 
 Return your response as a valid JSON object with the following structure:
 {
@@ -55,65 +183,125 @@ Content Richness Requirements:
 IMPORTANT: Return ONLY valid JSON, no markdown code blocks or additional text."""
 
 
+def get_system_prompt() -> str:
+    """Return the system prompt for presentation generation."""
+    return SYSTEM_PROMPT
+
+
+# Instructions come first and are byte-identical across calls, so
+# providers that hash the leading token span (DeepSeek, OpenAI,
+# Anthropic prompt caching) can serve the prefix from cache; all
+# per-call values live after the BEGIN CONTENT delimiter
+USER_PROMPT_PREAMBLE = """Please analyze the following content and create a COMPREHENSIVE PowerPoint presentation structure.
+
+Extract ALL valuable information and create as many slides as needed to fully represent the content with rich detail.
+
+Generate a thorough, detailed presentation that captures everything important from the content between the delimiters below."""
+
+
+@lru_cache(maxsize=1)
+def _token_encoder():
+    """Load the tokenizer once; get_encoding is slow on first call.
+
+    Returns None when the vocabulary cannot be loaded — get_encoding
+    downloads it on first use, so an offline machine with tiktoken
+    installed must not take generation down with it. The None is
+    cached, so the download is attempted once per process.
+    """
+    try:
+        return tiktoken.get_encoding('cl100k_base')
+    except Exception:
+        return None
+
+
+def _truncate_content(text: str) -> tuple:
+    """Truncate text to the input budget; returns (text, truncated).
+
+    With tiktoken installed the cut lands on a token boundary against
+    MAX_INPUT_TOKENS, so multi-byte-heavy documents (CJK, emoji) use
+    the model's window instead of being cut far short by the
+    character heuristic — and never overflow it either. Without
+    tiktoken, or when its vocabulary cannot be loaded, the original
+    MAX_INPUT_CHARS slice applies.
+    """
+    if tiktoken is not None:
+        encoder = _token_encoder()
+        if encoder is not None:
+            try:
+                ids = encoder.encode(text)
+                if len(ids) <= MAX_INPUT_TOKENS:
+                    return text, False
+                return encoder.decode(ids[:MAX_INPUT_TOKENS]), True
+            except Exception:
+                pass
+
+    if len(text) > MAX_INPUT_CHARS:
+        return text[:MAX_INPUT_CHARS], True
+    return text, False
+
+
 def get_user_prompt(file_content: str, file_name: str) -> str:
     """Generate the user prompt for presentation creation."""
-    # Truncate content if too long
-    if len(file_content) > MAX_INPUT_CHARS:
-        file_content = file_content[:MAX_INPUT_CHARS] + "\n\n[Content truncated due to length...]"
-    
-    return f"""Please analyze the following content from file "{file_name}" and create a COMPREHENSIVE PowerPoint presentation structure.
+    # Truncate content if too long; the marker is interpolated into
+    # the final f-string directly instead of concatenating an
+    # intermediate budget-sized copy first
+    file_content, truncated = _truncate_content(file_content)
+    truncation_note = "\n\n[Content truncated due to length...]" if truncated else ""
 
-Extract ALL valuable information and create as many slides as needed to fully represent the content with rich detail.
+    return f"""{USER_PROMPT_PREAMBLE}
+
+--- BEGIN CONTENT ---
+FILE: {file_name}
+{file_content}{truncation_note}
+--- END CONTENT ---"""
+
+
+# Appended to SYSTEM_PROMPT for multi-document calls; kept as a
+# constant suffix so the shared prefix stays cache-stable
+BATCH_SYSTEM_SUFFIX = """
+
+You will receive SEVERAL documents in one request, each introduced by a "--- DOCUMENT N: <name> ---" header. Return ONLY a valid JSON array containing one presentation object per document, in the same order as the documents, with no markdown or additional text."""
 
----
-{file_content}
----
 
-Generate a thorough, detailed presentation that captures everything important from this content."""
+def _apply_defaults(data: dict) -> dict:
+    """Validate a parsed presentation object and fill in defaults."""
+    if not isinstance(data, dict):
+        raise ValueError("Response is not a JSON object")
+
+    if 'slides' not in data:
+        data['slides'] = []
+
+    if 'title' not in data:
+        data['title'] = 'Generated Presentation'
+
+    return data
 
 
 def parse_llm_response(response_text: str) -> dict:
     """Parse and validate the LLM response as JSON."""
-    import re
-    
     # Clean up response if it contains markdown code blocks
-    cleaned = response_text.strip()
-    
-    if "```json" in cleaned:
-        cleaned = cleaned.split("```json")[1].split("```")[0]
-    elif "```" in cleaned:
-        # Try to extract content between first pair of ```
-        parts = cleaned.split("```")
-        if len(parts) >= 2:
-            cleaned = parts[1]
-    
-    cleaned = cleaned.strip()
-    
+    cleaned = _strip_fences(response_text.strip()).strip()
+
+    decoded = _decode_presentation(cleaned)
+    if decoded is not None:
+        return decoded
+
     try:
-        data = json.loads(cleaned)
-        
-        # Validate structure
-        if not isinstance(data, dict):
-            raise ValueError("Response is not a JSON object")
-        
-        if 'slides' not in data:
-            data['slides'] = []
-        
-        if 'title' not in data:
-            data['title'] = 'Generated Presentation'
-        
-        return data
-        
-    except json.JSONDecodeError as e:
-        # Try to find JSON object in the response
-        json_match = re.search(r'\{[\s\S]*\}', response_text)
-        if json_match:
+        data = _json_loads(cleaned)
+    except ValueError as e:
+        # Try to find a balanced JSON object in the response
+        candidate = _find_json_object(response_text)
+        data = None
+        if candidate:
             try:
-                return json.loads(json_match.group())
-            except json.JSONDecodeError:
+                data = _json_loads(candidate)
+            except ValueError:
                 pass
-        
-        raise ValueError(f"Failed to parse LLM response as JSON: {e}\nResponse preview: {response_text[:500]}...")
+
+        if data is None:
+            raise ValueError(f"Failed to parse LLM response as JSON: {e}\nResponse preview: {response_text[:500]}...")
+
+    return _apply_defaults(data)
 
 
 def generate_presentation_content(
@@ -121,26 +309,45 @@ def generate_presentation_content(
     file_name: str,
     provider_name: str = "deepseek",
     progress_callback: Optional[Callable[[float], None]] = None,
+    use_cache: bool = True,
+    cache_ttl: Optional[float] = None,
+    refresh: bool = False,
     **provider_kwargs
 ) -> dict:
     """
     Use LLM to analyze file content and generate presentation structure.
-    
+
     Args:
         file_content: The content of the file to analyze.
         file_name: The name of the source file.
         provider_name: LLM provider to use ('deepseek', 'openai', 'anthropic', 'ollama')
         progress_callback: Optional callback for progress updates (0.0 to 1.0).
+        use_cache: Serve repeated prompts from the local response cache.
+        cache_ttl: Optional maximum cache entry age in seconds.
+        refresh: Skip the cache lookup but overwrite the entry with
+            the fresh response, invalidating whatever was stored.
         **provider_kwargs: Additional provider-specific arguments
-        
+
     Returns:
         A dictionary containing the presentation structure with slides.
     """
-    provider = create_provider(provider_name, **provider_kwargs)
-    
-    system_prompt = get_system_prompt()
+    provider = _cached_provider(provider_name, tuple(sorted(provider_kwargs.items())))
+
+    system_prompt = SYSTEM_PROMPT
     user_prompt = get_user_prompt(file_content, file_name)
-    
+
+    # Identical prompts to the same provider produce the same deck;
+    # a cache hit skips the multi-second API round trip entirely
+    cache_key = None
+    if use_cache:
+        cache_key = cache.make_key(provider_name, system_prompt, user_prompt)
+        if not refresh:
+            cached = cache.lookup(cache_key, max_age=cache_ttl)
+            if cached is not None:
+                if progress_callback:
+                    progress_callback(1.0)
+                return cached
+
     try:
         response_text = provider.generate(
             system_prompt,
@@ -150,12 +357,92 @@ def generate_presentation_content(
         
         # Parse and validate response
         presentation_data = parse_llm_response(response_text)
-        
+
+        if cache_key is not None:
+            cache.store(cache_key, presentation_data)
+
         # Final progress update
         if progress_callback:
             progress_callback(1.0)
-        
+
         return presentation_data
         
     except Exception as e:
         raise ValueError(f"Failed to generate presentation using {provider.get_name()}: {e}")
+
+def generate_presentation_content_batch(
+    file_contents: list,
+    file_names: list,
+    provider_name: str = "deepseek",
+    use_cache: bool = True,
+    cache_ttl: Optional[float] = None,
+    **provider_kwargs
+) -> list:
+    """
+    Generate presentation structures for several documents in one call.
+
+    Packing a batch of small documents into a single request pays the
+    round trip and the repeated instruction tokens once instead of
+    once per file. Any failure to split the combined response cleanly
+    falls back to per-document calls, so callers always get one
+    presentation dict per input.
+
+    Args:
+        file_contents: Document texts, one per file.
+        file_names: Matching source file names.
+        provider_name: LLM provider to use ('deepseek', 'openai', 'anthropic', 'ollama')
+        use_cache: Serve repeated prompts from the local response cache.
+        cache_ttl: Optional maximum cache entry age in seconds.
+        **provider_kwargs: Additional provider-specific arguments
+
+    Returns:
+        List of presentation dicts, in input order.
+    """
+    if len(file_contents) != len(file_names):
+        raise ValueError("file_contents and file_names must have the same length")
+
+    def _fallback() -> list:
+        return [
+            generate_presentation_content(
+                content, name, provider_name,
+                use_cache=use_cache, cache_ttl=cache_ttl, **provider_kwargs
+            )
+            for content, name in zip(file_contents, file_names)
+        ]
+
+    if len(file_contents) < 2:
+        return _fallback()
+
+    provider = _cached_provider(provider_name, tuple(sorted(provider_kwargs.items())))
+    system_prompt = SYSTEM_PROMPT + BATCH_SYSTEM_SUFFIX
+
+    sections = [USER_PROMPT_PREAMBLE]
+    for i, (content, name) in enumerate(zip(file_contents, file_names), 1):
+        content, truncated = _truncate_content(content)
+        note = "\n\n[Content truncated due to length...]" if truncated else ""
+        sections.append(f"--- DOCUMENT {i}: {name} ---\n{content}{note}")
+    user_prompt = "\n\n".join(sections)
+
+    cache_key = None
+    if use_cache:
+        cache_key = cache.make_key(provider_name, system_prompt, user_prompt)
+        cached = cache.lookup(cache_key, max_age=cache_ttl)
+        if cached is not None:
+            return cached
+
+    try:
+        response_text = provider.generate(system_prompt, user_prompt, None)
+        parsed = _json_loads(_strip_fences(response_text.strip()).strip())
+        if isinstance(parsed, dict):
+            parsed = parsed.get('presentations')
+        if not isinstance(parsed, list) or len(parsed) != len(file_contents):
+            raise ValueError("batch response does not match document count")
+        presentations = [_apply_defaults(item) for item in parsed]
+    except Exception:
+        # One bad combined response should not sink the whole batch
+        return _fallback()
+
+    if cache_key is not None:
+        cache.store(cache_key, presentations)
+
+    return presentations
@@ -1,13 +1,16 @@
 """LLM provider implementations for multiple AI services."""
 
+import asyncio
+import atexit
 import os
 import json
+import random
 import time
+from email.utils import parsedate_to_datetime
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from typing import Dict, Any, Optional, Callable
 
-from openai import OpenAI, APIError, RateLimitError, APIConnectionError
-
 from config import (
     MAX_TOKENS,
     RETRY_ATTEMPTS,
@@ -18,19 +21,300 @@ from config import (
 )
 
 
+# The openai SDK (with httpx and pydantic behind it) costs ~100ms and
+# tens of MB to import, so it is loaded lazily like anthropic and
+# requests already are: only when an OpenAI-compatible provider is
+# actually constructed or raises.
+@lru_cache(maxsize=1)
+def _openai_errors() -> tuple:
+    """Return the retryable openai exception types."""
+    from openai import APIError, RateLimitError, APIConnectionError
+    return RateLimitError, APIConnectionError, APIError
+
+
+def _pool_http_kwargs():
+    """Connection-pool and timeout settings for the shared clients."""
+    try:
+        import httpx
+    except ImportError:
+        return {}
+
+    return {
+        'limits': httpx.Limits(
+            max_keepalive_connections=32,
+            max_connections=64,
+            keepalive_expiry=60,
+        ),
+        'timeout': httpx.Timeout(connect=10, read=120, write=60, pool=5),
+    }
+
+
+@lru_cache(maxsize=8)
+def _shared_openai_client(api_key: str, base_url: Optional[str]):
+    """Return one OpenAI client per (api_key, base_url).
+
+    Each client owns an HTTP connection pool, so sharing it across
+    provider instances keeps TCP/TLS connections alive between
+    requests instead of paying a fresh handshake per call.
+    """
+    from openai import OpenAI, DefaultHttpxClient
+
+    # The providers' own retry loops are authoritative; leaving the
+    # SDK's default max_retries=2 in place would multiply attempts
+    # (and tail latency) on transient failures
+    client = OpenAI(
+        api_key=api_key,
+        base_url=base_url,
+        max_retries=0,
+        http_client=DefaultHttpxClient(**_pool_http_kwargs()),
+    )
+    _LIVE_CLIENTS.append(client)
+    return client
+
+
+@lru_cache(maxsize=8)
+def _shared_async_openai_client(api_key: str, base_url: Optional[str]):
+    """Async sibling of _shared_openai_client, for concurrent batches."""
+    from openai import AsyncOpenAI, DefaultAsyncHttpxClient
+
+    client = AsyncOpenAI(
+        api_key=api_key,
+        base_url=base_url,
+        max_retries=0,
+        http_client=DefaultAsyncHttpxClient(**_pool_http_kwargs()),
+    )
+    _LIVE_CLIENTS.append(client)
+    return client
+
+
+# The cached factories above hand out long-lived clients; this
+# registry lets close_clients() reach them at interpreter exit so the
+# pooled sockets are shut down cleanly instead of leaking to the OS
+_LIVE_CLIENTS: list = []
+
+
+def close_clients() -> None:
+    """Close every pooled HTTP client opened by the shared factories.
+
+    Registered with atexit; safe to call earlier (e.g. from tests or a
+    long-lived host application) — the factories repopulate on demand.
+    """
+    _shared_openai_client.cache_clear()
+    _shared_async_openai_client.cache_clear()
+    while _LIVE_CLIENTS:
+        client = _LIVE_CLIENTS.pop()
+        try:
+            result = client.close()
+            if asyncio.iscoroutine(result):
+                asyncio.run(result)
+        except Exception:
+            pass
+
+
+atexit.register(close_clients)
+
+
+# Cap on exponential backoff so a transient outage never parks a run
+# for minutes between attempts
+_BACKOFF_CAP = 60
+
+
+def _retry_after_seconds(exc: Exception) -> Optional[float]:
+    """Return the server-advertised Retry-After delay, if any."""
+    response = getattr(exc, 'response', None)
+    headers = getattr(response, 'headers', None)
+    if not headers:
+        return None
+
+    value = headers.get('retry-after')
+    if not value:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    # HTTP-date form
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+# Rough size of a long generated deck, used only to scale streaming
+# progress; responses past this size just hold the bar at its cap
+_EXPECTED_RESPONSE_CHARS = 20_000
+_PROGRESS_STEP = 0.01  # Only report progress once it has moved a whole percent
+
+
+def _stream_progress(received: int) -> float:
+    """Map characters received so far onto the 0.2-0.8 progress band."""
+    return min(0.8, 0.2 + received / _EXPECTED_RESPONSE_CHARS * 0.6)
+
+
+def _collect_stream(response, progress_callback: Optional[Callable[[float], None]]) -> str:
+    """Join a chat-completions stream, reporting progress per chunk.
+
+    Streaming turns the single long stall between request and full
+    payload into continuous feedback: the progress bar advances with
+    tokens received instead of jumping from 0.3 to 0.8 at the end.
+    Updates are rate-limited to whole-percent steps so a stream of
+    thousands of small deltas does not spend its time repainting.
+    """
+    parts = []
+    received = 0
+    reported = 0.0
+
+    for chunk in response:
+        if not chunk.choices:
+            continue
+        piece = chunk.choices[0].delta.content or ''
+        if piece:
+            parts.append(piece)
+            received += len(piece)
+            if progress_callback:
+                fraction = _stream_progress(received)
+                if fraction - reported >= _PROGRESS_STEP:
+                    progress_callback(fraction)
+                    reported = fraction
+
+    return ''.join(parts)
+
+
+async def _acollect_stream(response, progress_callback: Optional[Callable[[float], None]]) -> str:
+    """Async sibling of _collect_stream for AsyncOpenAI streams."""
+    parts = []
+    received = 0
+    reported = 0.0
+
+    async for chunk in response:
+        if not chunk.choices:
+            continue
+        piece = chunk.choices[0].delta.content or ''
+        if piece:
+            parts.append(piece)
+            received += len(piece)
+            if progress_callback:
+                fraction = _stream_progress(received)
+                if fraction - reported >= _PROGRESS_STEP:
+                    progress_callback(fraction)
+                    reported = fraction
+
+    return ''.join(parts)
+
+
+def _backoff_delay(attempt: int, exc: Exception) -> float:
+    """Delay before retry attempt, honoring Retry-After when present.
+
+    Rate-limited responses tell us exactly when to come back; for
+    everything else, exponential backoff with jitter avoids the
+    thundering-herd retries that linear delays cause against a
+    struggling API.
+    """
+    delay = _retry_after_seconds(exc)
+    if delay is None:
+        delay = min(_BACKOFF_CAP, RETRY_DELAY * (2 ** attempt)) + random.random() * 0.5
+    return delay
+
+
+def _sleep_backoff(attempt: int, exc: Exception) -> None:
+    """Block the calling thread for the backoff delay."""
+    time.sleep(_backoff_delay(attempt, exc))
+
+
 class LLMProvider(ABC):
     """Abstract base class for LLM providers."""
-    
-    @abstractmethod
+
     def generate(
         self,
         system_prompt: str,
         user_prompt: str,
         progress_callback: Optional[Callable[[float], None]] = None
     ) -> str:
-        """Generate content from prompts."""
+        """Generate content from prompts, retrying transient failures.
+
+        The retry scaffolding lives here once, so backoff and
+        progress behavior stay identical across providers; each
+        subclass only implements the single-attempt _call_api.
+        """
+        last_error = None
+
+        for attempt in range(RETRY_ATTEMPTS):
+            try:
+                if progress_callback:
+                    progress_callback(attempt / RETRY_ATTEMPTS * 0.3)
+
+                result = self._call_api(system_prompt, user_prompt, progress_callback)
+
+                if progress_callback:
+                    progress_callback(0.8)
+
+                return result
+
+            except self._retryable_errors() as e:
+                last_error = e
+                if attempt < RETRY_ATTEMPTS - 1:
+                    _sleep_backoff(attempt, e)
+
+        raise ValueError(f"{self.get_name()} API failed after {RETRY_ATTEMPTS} attempts: {last_error}")
+
+    async def agenerate(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        progress_callback: Optional[Callable[[float], None]] = None
+    ) -> str:
+        """Async variant of generate for concurrent batch runs.
+
+        Backoff waits are awaited rather than slept, so one
+        rate-limited request never stalls the other in-flight calls
+        sharing the event loop.
+        """
+        last_error = None
+
+        for attempt in range(RETRY_ATTEMPTS):
+            try:
+                if progress_callback:
+                    progress_callback(attempt / RETRY_ATTEMPTS * 0.3)
+
+                result = await self._acall_api(system_prompt, user_prompt, progress_callback)
+
+                if progress_callback:
+                    progress_callback(0.8)
+
+                return result
+
+            except self._retryable_errors() as e:
+                last_error = e
+                if attempt < RETRY_ATTEMPTS - 1:
+                    await asyncio.sleep(_backoff_delay(attempt, e))
+
+        raise ValueError(f"{self.get_name()} API failed after {RETRY_ATTEMPTS} attempts: {last_error}")
+
+    def _retryable_errors(self) -> tuple:
+        """Exception types the retry loop should swallow."""
+        return (Exception,)
+
+    async def _acall_api(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        progress_callback: Optional[Callable[[float], None]] = None
+    ) -> str:
+        """Async single attempt; defaults to _call_api on a thread."""
+        return await asyncio.to_thread(self._call_api, system_prompt, user_prompt, progress_callback)
+
+    @abstractmethod
+    def _call_api(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        progress_callback: Optional[Callable[[float], None]] = None
+    ) -> str:
+        """Issue one API request and return the response text."""
         pass
-    
+
     @abstractmethod
     def get_name(self) -> str:
         """Get provider name."""
@@ -45,49 +329,52 @@ class DeepSeekProvider(LLMProvider):
         self.api_key = DEEPSEEK_API_KEY
         self.base_url = DEEPSEEK_BASE_URL
         self.model = DEEPSEEK_MODEL
-        self.client = OpenAI(
-            api_key=self.api_key,
-            base_url=self.base_url
-        )
+        self.client = _shared_openai_client(self.api_key, self.base_url)
+        self.aclient = _shared_async_openai_client(self.api_key, self.base_url)
     
-    def generate(
+    def _retryable_errors(self) -> tuple:
+        return _openai_errors()
+
+    def _call_api(
         self,
         system_prompt: str,
         user_prompt: str,
         progress_callback: Optional[Callable[[float], None]] = None
     ) -> str:
-        """Generate content using DeepSeek API."""
-        last_error = None
-        
-        for attempt in range(RETRY_ATTEMPTS):
-            try:
-                if progress_callback:
-                    progress_callback(attempt / RETRY_ATTEMPTS * 0.3)
-                
-                response = self.client.chat.completions.create(
-                    model=self.model,
-                    messages=[
-                        {"role": "system", "content": system_prompt},
-                        {"role": "user", "content": user_prompt},
-                    ],
-                    stream=False,
-                    max_tokens=MAX_TOKENS,
-                    temperature=0.7,
-                )
-                
-                if progress_callback:
-                    progress_callback(0.8)
-                
-                return response.choices[0].message.content
-                
-            except (RateLimitError, APIConnectionError, APIError) as e:
-                last_error = e
-                if attempt < RETRY_ATTEMPTS - 1:
-                    wait_time = RETRY_DELAY * (attempt + 1)
-                    time.sleep(wait_time)
-        
-        raise ValueError(f"DeepSeek API failed after {RETRY_ATTEMPTS} attempts: {last_error}")
-    
+        """Issue one DeepSeek chat-completion request."""
+        response = self.client.chat.completions.create(
+            model=self.model,
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt},
+            ],
+            stream=True,
+            max_tokens=MAX_TOKENS,
+            temperature=0.7,
+        )
+
+        return _collect_stream(response, progress_callback)
+
+    async def _acall_api(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        progress_callback: Optional[Callable[[float], None]] = None
+    ) -> str:
+        """Issue one DeepSeek request on the async client."""
+        response = await self.aclient.chat.completions.create(
+            model=self.model,
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt},
+            ],
+            stream=True,
+            max_tokens=MAX_TOKENS,
+            temperature=0.7,
+        )
+
+        return await _acollect_stream(response, progress_callback)
+
     def get_name(self) -> str:
         """Get provider name."""
         return "DeepSeek"
@@ -103,45 +390,52 @@ class OpenAIProvider(LLMProvider):
             raise ValueError("OPENAI_API_KEY environment variable not set")
         
         self.model = model
-        self.client = OpenAI(api_key=self.api_key)
+        self.client = _shared_openai_client(self.api_key, None)
+        self.aclient = _shared_async_openai_client(self.api_key, None)
     
-    def generate(
+    def _retryable_errors(self) -> tuple:
+        return _openai_errors()
+
+    def _call_api(
         self,
         system_prompt: str,
         user_prompt: str,
         progress_callback: Optional[Callable[[float], None]] = None
     ) -> str:
-        """Generate content using OpenAI API."""
-        last_error = None
-        
-        for attempt in range(RETRY_ATTEMPTS):
-            try:
-                if progress_callback:
-                    progress_callback(attempt / RETRY_ATTEMPTS * 0.3)
-                
-                response = self.client.chat.completions.create(
-                    model=self.model,
-                    messages=[
-                        {"role": "system", "content": system_prompt},
-                        {"role": "user", "content": user_prompt},
-                    ],
-                    max_tokens=MAX_TOKENS,
-                    temperature=0.7,
-                )
-                
-                if progress_callback:
-                    progress_callback(0.8)
-                
-                return response.choices[0].message.content
-                
-            except (RateLimitError, APIConnectionError, APIError) as e:
-                last_error = e
-                if attempt < RETRY_ATTEMPTS - 1:
-                    wait_time = RETRY_DELAY * (attempt + 1)
-                    time.sleep(wait_time)
-        
-        raise ValueError(f"OpenAI API failed after {RETRY_ATTEMPTS} attempts: {last_error}")
-    
+        """Issue one OpenAI chat-completion request."""
+        response = self.client.chat.completions.create(
+            model=self.model,
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt},
+            ],
+            stream=True,
+            max_tokens=MAX_TOKENS,
+            temperature=0.7,
+        )
+
+        return _collect_stream(response, progress_callback)
+
+    async def _acall_api(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        progress_callback: Optional[Callable[[float], None]] = None
+    ) -> str:
+        """Issue one OpenAI request on the async client."""
+        response = await self.aclient.chat.completions.create(
+            model=self.model,
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt},
+            ],
+            stream=True,
+            max_tokens=MAX_TOKENS,
+            temperature=0.7,
+        )
+
+        return await _acollect_stream(response, progress_callback)
+
     def get_name(self) -> str:
         """Get provider name."""
         return f"OpenAI ({self.model})"
@@ -161,45 +455,59 @@ class AnthropicProvider(LLMProvider):
         try:
             import anthropic
             self.client = anthropic.Anthropic(api_key=self.api_key)
+            self.aclient = anthropic.AsyncAnthropic(api_key=self.api_key)
         except ImportError:
             raise ImportError("anthropic package not installed. Run: pip install anthropic")
     
-    def generate(
+    def _call_api(
         self,
         system_prompt: str,
         user_prompt: str,
         progress_callback: Optional[Callable[[float], None]] = None
     ) -> str:
-        """Generate content using Anthropic API."""
-        last_error = None
-        
-        for attempt in range(RETRY_ATTEMPTS):
-            try:
-                if progress_callback:
-                    progress_callback(attempt / RETRY_ATTEMPTS * 0.3)
-                
-                response = self.client.messages.create(
-                    model=self.model,
-                    max_tokens=MAX_TOKENS,
-                    system=system_prompt,
-                    messages=[
-                        {"role": "user", "content": user_prompt}
-                    ],
-                    temperature=0.7,
-                )
-                
-                if progress_callback:
-                    progress_callback(0.8)
-                
-                return response.content[0].text
-                
-            except Exception as e:
-                last_error = e
-                if attempt < RETRY_ATTEMPTS - 1:
-                    wait_time = RETRY_DELAY * (attempt + 1)
-                    time.sleep(wait_time)
-        
-        raise ValueError(f"Anthropic API failed after {RETRY_ATTEMPTS} attempts: {last_error}")
+        """Issue one Anthropic messages request."""
+        response = self.client.messages.create(
+            model=self.model,
+            max_tokens=MAX_TOKENS,
+            # Marking the static system block cacheable lets the API
+            # reuse its KV prefix across calls at reduced input cost
+            system=[{
+                "type": "text",
+                "text": system_prompt,
+                "cache_control": {"type": "ephemeral"},
+            }],
+            messages=[
+                {"role": "user", "content": user_prompt}
+            ],
+            temperature=0.7,
+        )
+
+        return response.content[0].text
+
+    async def _acall_api(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        progress_callback: Optional[Callable[[float], None]] = None
+    ) -> str:
+        """Issue one Anthropic request on the async client."""
+        response = await self.aclient.messages.create(
+            model=self.model,
+            max_tokens=MAX_TOKENS,
+            # Marking the static system block cacheable lets the API
+            # reuse its KV prefix across calls at reduced input cost
+            system=[{
+                "type": "text",
+                "text": system_prompt,
+                "cache_control": {"type": "ephemeral"},
+            }],
+            messages=[
+                {"role": "user", "content": user_prompt}
+            ],
+            temperature=0.7,
+        )
+
+        return response.content[0].text
     
     def get_name(self) -> str:
         """Get provider name."""
@@ -216,52 +524,43 @@ class OllamaProvider(LLMProvider):
         
         try:
             import requests
-            self.requests = requests
         except ImportError:
             raise ImportError("requests package not installed. Run: pip install requests")
+
+        # A session keeps the TCP connection to the local daemon
+        # alive across calls and retries instead of paying a fresh
+        # handshake per request
+        self._session = requests.Session()
+
+    def __del__(self):
+        session = getattr(self, '_session', None)
+        if session is not None:
+            session.close()
     
-    def generate(
+    def _call_api(
         self,
         system_prompt: str,
         user_prompt: str,
         progress_callback: Optional[Callable[[float], None]] = None
     ) -> str:
-        """Generate content using Ollama local API."""
-        last_error = None
-        
-        for attempt in range(RETRY_ATTEMPTS):
-            try:
-                if progress_callback:
-                    progress_callback(attempt / RETRY_ATTEMPTS * 0.3)
-                
-                response = self.requests.post(
-                    f"{self.base_url}/api/generate",
-                    json={
-                        "model": self.model,
-                        "prompt": f"System: {system_prompt}\n\nUser: {user_prompt}",
-                        "stream": False,
-                        "options": {
-                            "temperature": 0.7,
-                            "num_predict": MAX_TOKENS,
-                        }
-                    },
-                    timeout=300
-                )
-                
-                response.raise_for_status()
-                
-                if progress_callback:
-                    progress_callback(0.8)
-                
-                return response.json()["response"]
-                
-            except Exception as e:
-                last_error = e
-                if attempt < RETRY_ATTEMPTS - 1:
-                    wait_time = RETRY_DELAY * (attempt + 1)
-                    time.sleep(wait_time)
-        
-        raise ValueError(f"Ollama API failed after {RETRY_ATTEMPTS} attempts: {last_error}")
+        """Issue one Ollama generate request."""
+        response = self._session.post(
+            f"{self.base_url}/api/generate",
+            json={
+                "model": self.model,
+                "prompt": f"System: {system_prompt}\n\nUser: {user_prompt}",
+                "stream": False,
+                "options": {
+                    "temperature": 0.7,
+                    "num_predict": MAX_TOKENS,
+                }
+            },
+            timeout=300
+        )
+
+        response.raise_for_status()
+
+        return response.json()["response"]
     
     def get_name(self) -> str:
         """Get provider name."""
@@ -298,10 +597,34 @@ def create_provider(provider_name: str, **kwargs) -> LLMProvider:
     return providers[provider_name](**kwargs)
 
 
+def warm_up(provider_name: str, **kwargs) -> None:
+    """Open the provider's HTTP connection ahead of the first call.
+
+    Run from a background thread at startup, this pays the TCP+TLS
+    handshake (a few hundred ms against remote APIs) while the user
+    is still looking at the banner; the first real request then
+    reuses the warm connection from the shared pool. Never raises -
+    a failed warmup just means the first call pays full price.
+    """
+    try:
+        provider = create_provider(provider_name, **kwargs)
+        client = getattr(provider, 'client', None)
+        if client is not None and hasattr(client, 'models'):
+            client.models.list()
+        elif hasattr(provider, '_session'):
+            provider._session.get(f"{provider.base_url}/api/tags", timeout=5)
+    except Exception:
+        pass
+
+
+@lru_cache(maxsize=1)
 def get_available_providers() -> Dict[str, str]:
     """
     Get list of available providers with their descriptions.
-    
+
+    The table is static, so repeat callers (argparse choices, the
+    --providers listing) share one dict instead of rebuilding it.
+
     Returns:
         Dictionary of provider names to descriptions
     """
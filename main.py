@@ -17,29 +17,37 @@ Examples:
 
 import sys
 import argparse
+import threading
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, List
 
 from rich.console import Console
-from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
-from rich.prompt import Prompt, Confirm
-from rich.table import Table
-from rich import box
 
-from file_reader import read_file, get_file_info
-from llm_client import generate_presentation_content
-from pptx_generator import generate_pptx
-from config import SUPPORTED_EXTENSIONS, THEMES, APP_NAME, APP_VERSION, EXPORT_FORMATS, DEFAULT_LLM_PROVIDER
-from llm_providers import get_available_providers
-from export_utils import export_presentation
+from config import (
+    SUPPORTED_EXTENSIONS, THEMES, APP_NAME, APP_VERSION, EXPORT_FORMATS,
+    DEFAULT_LLM_PROVIDER, BATCH_LLM_GROUP_SIZE, BATCH_LLM_SMALL_FILE_BYTES
+)
+
+# The pipeline modules (python-pptx, the LLM SDKs, the PDF/DOCX
+# parsers) cost hundreds of ms and tens of MB to import, so they are
+# loaded inside the functions that run the pipeline; info flags like
+# --formats/--themes/--help never pay for them.
 
 
 console = Console()
 
+# Frozen once at import: argparse choices and the interactive prompt
+# re-read these on every invocation
+_THEME_KEYS = tuple(THEMES.keys())
+
 
 def show_banner():
     """Display application banner."""
+    # Piped/redirected output has no use for the box art; skip it
+    if not sys.stdout.isatty():
+        return
+
     banner = f"""
 [bold cyan]╔══════════════════════════════════════════════════════════════╗
 ║                                                                ║
@@ -52,8 +60,13 @@ def show_banner():
     console.print(banner)
 
 
-def show_supported_formats():
-    """Display supported file formats in a table."""
+@lru_cache(maxsize=1)
+def _formats_table():
+    """Build the supported-formats table; cached, the data is static."""
+    # Deferred: only table-rendering commands pay for rich.table
+    from rich.table import Table
+    from rich import box
+
     table = Table(
         title="📄 Supported File Formats",
         box=box.ROUNDED,
@@ -78,12 +91,22 @@ def show_supported_formats():
     
     for ext, file_type in SUPPORTED_EXTENSIONS.items():
         table.add_row(ext, file_type.title(), descriptions.get(ext, ''))
-    
-    console.print(table)
 
+    return table
+
+
+def show_supported_formats():
+    """Display supported file formats in a table."""
+    console.print(_formats_table())
+
+
+@lru_cache(maxsize=1)
+def _themes_table():
+    """Build the theme listing table; cached, the data is static."""
+    # Deferred: only table-rendering commands pay for rich.table
+    from rich.table import Table
+    from rich import box
 
-def show_themes():
-    """Display available presentation themes."""
     table = Table(
         title="🎨 Available Themes",
         box=box.ROUNDED,
@@ -95,12 +118,23 @@ def show_themes():
     
     for name, theme in THEMES.items():
         table.add_row(name.title(), theme['primary_color'], theme['style'])
-    
-    console.print(table)
 
+    return table
+
+
+def show_themes():
+    """Display available presentation themes."""
+    console.print(_themes_table())
+
+
+@lru_cache(maxsize=1)
+def _providers_table():
+    """Build the provider listing table; cached, the data is static."""
+    from llm_providers import get_available_providers
+    # Deferred: only table-rendering commands pay for rich.table
+    from rich.table import Table
+    from rich import box
 
-def show_providers():
-    """Display available LLM providers."""
     table = Table(
         title="🤖 Available LLM Providers",
         box=box.ROUNDED,
@@ -111,8 +145,13 @@ def show_providers():
     
     for name, description in get_available_providers().items():
         table.add_row(name.title(), description)
-    
-    console.print(table)
+
+    return table
+
+
+def show_providers():
+    """Display available LLM providers."""
+    console.print(_providers_table())
 
 
 def get_output_path(input_file: str, output_file: Optional[str] = None) -> str:
@@ -128,6 +167,9 @@ def get_output_path(input_file: str, output_file: Optional[str] = None) -> str:
 
 def interactive_mode():
     """Run in interactive mode with user prompts."""
+    from rich.prompt import Prompt, Confirm
+    from rich.panel import Panel
+
     show_banner()
     console.print()
     
@@ -171,7 +213,7 @@ def interactive_mode():
     console.print()
     
     # Select theme
-    theme_choices = list(THEMES.keys())
+    theme_choices = list(_THEME_KEYS)
     theme = Prompt.ask(
         "[bold cyan]🎨 Select theme[/bold cyan]",
         choices=theme_choices,
@@ -198,14 +240,38 @@ def interactive_mode():
 
 
 def run_generation(
-    input_file: str, 
-    output_file: str, 
+    input_file: str,
+    output_file: str,
     theme: str = "professional",
     provider: str = "deepseek",
-    export_format: Optional[str] = None
+    export_format: Optional[str] = None,
+    use_cache: bool = True,
+    cache_ttl: Optional[float] = None,
+    refresh: bool = False
 ):
-    """Execute the presentation generation pipeline."""
-    
+    """Execute the presentation generation pipeline.
+
+    Iterating on --theme or --export reuses the cached LLM response,
+    so only the cheap rendering steps rerun; refresh forces one new
+    LLM call and overwrites the cached entry. Repeat calls with the
+    same provider also reuse the provider-side prompt-prefix cache
+    (the system prompt and instruction preamble are byte-stable);
+    switching provider starts that cache cold.
+    """
+
+    from rich.panel import Panel
+    from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
+
+    from file_reader import read_file, get_file_info
+    from llm_client import generate_presentation_content
+    from pptx_generator import generate_pptx
+    from export_utils import export_presentation
+
+    # Derive paths once, outside the progress loop; callers normally
+    # pass an already-resolved output path
+    output_path = output_file or get_output_path(input_file)
+    file_name = Path(input_file).name
+
     with Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
@@ -229,22 +295,27 @@ def run_generation(
             
             # Step 2: Generate presentation content using LLM (20-80%)
             progress.update(main_task, description=f"[cyan]🤖 Analyzing with {provider.title()}...")
-            file_name = Path(input_file).name
-            
             presentation_data = generate_presentation_content(
-                file_content, 
+                file_content,
                 file_name,
                 provider_name=provider,
-                progress_callback=lambda p: progress.update(main_task, completed=20 + int(p * 60))
+                progress_callback=lambda p: progress.update(main_task, completed=20 + p * 60),
+                use_cache=use_cache,
+                cache_ttl=cache_ttl,
+                refresh=refresh
             )
-            
+
+            # The full document text is dead weight from here on;
+            # dropping it early keeps per-worker memory flat when
+            # several large files are in flight in batch mode
+            del file_content
+
             slide_count = len(presentation_data.get('slides', []))
             progress.update(main_task, completed=80)
             console.print(f"   [dim]→ Generated {slide_count} slides[/dim]")
             
             # Step 3: Create the PowerPoint file (80-95%)
             progress.update(main_task, description="[cyan]📊 Creating PowerPoint file...")
-            output_path = get_output_path(input_file, output_file)
             generate_pptx(presentation_data, output_path, theme)
             progress.update(main_task, completed=95)
             
@@ -292,30 +363,203 @@ def run_generation(
     ))
 
 
+def _render_pool(file_count: int):
+    """Process pool for CPU-bound PPTX rendering in batch mode.
+
+    generate_pptx is pure-Python XML/ZIP construction and holds the
+    GIL, so threads cannot parallelize it; processes can. Spawn (not
+    fork) keeps the workers clear of the live rich console and any
+    open sockets in the parent.
+    """
+    import os
+    from concurrent.futures import ProcessPoolExecutor
+    from multiprocessing import get_context
+
+    return ProcessPoolExecutor(
+        max_workers=min(file_count, os.cpu_count() or 1),
+        mp_context=get_context("spawn")
+    )
+
+
+def _process_batch_file(
+    input_file: str,
+    theme: str,
+    provider: str,
+    export_format: Optional[str],
+    use_cache: bool = True,
+    cache_ttl: Optional[float] = None,
+    render_pool=None
+) -> str:
+    """Run the full pipeline for one batch file; returns the output path.
+
+    Console-quiet variant of run_generation, safe to run on a pool
+    worker thread alongside other files. When render_pool is given,
+    the CPU-bound generate_pptx step runs on it instead of in-thread.
+    """
+    from file_reader import read_file
+    from llm_client import generate_presentation_content
+    from pptx_generator import generate_pptx
+    from export_utils import export_presentation
+
+    output_path = get_output_path(input_file)
+    file_content = read_file(input_file)
+    file_name = Path(input_file).name
+
+    presentation_data = generate_presentation_content(
+        file_content,
+        file_name,
+        provider_name=provider,
+        use_cache=use_cache,
+        cache_ttl=cache_ttl
+    )
+    del file_content
+
+    if render_pool is not None:
+        render_pool.submit(generate_pptx, presentation_data, output_path, theme).result()
+    else:
+        generate_pptx(presentation_data, output_path, theme)
+
+    if export_format:
+        export_presentation(output_path, export_format)
+
+    return output_path
+
+
+def _files_pack_small(input_files: List[str]) -> bool:
+    """True when every batch file is small enough to share LLM calls."""
+    if len(input_files) < 2:
+        return False
+    try:
+        return all(Path(f).stat().st_size <= BATCH_LLM_SMALL_FILE_BYTES for f in input_files)
+    except OSError:
+        return False
+
+
+def _packed_batch_pairs(
+    input_files: List[str],
+    theme: str,
+    provider: str,
+    export_format: Optional[str],
+    use_cache: bool,
+    cache_ttl: Optional[float],
+    progress,
+    task,
+    render_pool
+) -> list:
+    """Generate decks for small files with one LLM call per group.
+
+    Packing BATCH_LLM_GROUP_SIZE documents into a request pays the
+    round trip and the instruction tokens once per group instead of
+    once per file; PPTX rendering then fans out on the process pool.
+    Returns (input_file, output_path_or_exception) pairs.
+    """
+    from file_reader import read_file
+    from llm_client import generate_presentation_content_batch
+    from pptx_generator import generate_pptx
+    from export_utils import export_presentation
+
+    pairs = []
+
+    for start in range(0, len(input_files), BATCH_LLM_GROUP_SIZE):
+        group = input_files[start:start + BATCH_LLM_GROUP_SIZE]
+
+        try:
+            contents = [read_file(f) for f in group]
+            names = [Path(f).name for f in group]
+            datas = generate_presentation_content_batch(
+                contents, names, provider_name=provider,
+                use_cache=use_cache, cache_ttl=cache_ttl
+            )
+        except Exception as e:
+            for f in group:
+                pairs.append((f, e))
+                progress.advance(task)
+            continue
+
+        out_paths = [get_output_path(f) for f in group]
+        futures = [
+            render_pool.submit(generate_pptx, d, out, theme)
+            for d, out in zip(datas, out_paths)
+        ]
+
+        for f, out, future in zip(group, out_paths, futures):
+            try:
+                future.result()
+                if export_format:
+                    export_presentation(out, export_format)
+                pairs.append((f, out))
+            except Exception as e:
+                pairs.append((f, e))
+            progress.advance(task)
+
+    return pairs
+
+
 def run_batch_generation(
     input_files: List[str],
     theme: str = "professional",
     provider: str = "deepseek",
-    export_format: Optional[str] = None
+    export_format: Optional[str] = None,
+    max_concurrent: int = 5,
+    use_cache: bool = True,
+    cache_ttl: Optional[float] = None
 ):
-    """Process multiple files in batch mode."""
+    """Process multiple files in batch mode with concurrent LLM calls."""
+    from rich.panel import Panel
+    from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
+
+    from batch import run_batch_sync
+
     console.print(f"\n[bold cyan]📂 Batch Processing {len(input_files)} files[/bold cyan]\n")
-    
+
     results = {'success': [], 'failed': []}
-    
-    for i, input_file in enumerate(input_files, 1):
-        console.print(f"[bold]File {i}/{len(input_files)}:[/bold] {Path(input_file).name}")
-        
-        try:
-            output_file = get_output_path(input_file)
-            run_generation(input_file, output_file, theme, provider, export_format)
+
+    # The network-bound LLM calls fan out through the bounded thread
+    # pool while the CPU-bound PPTX rendering fans out across cores on
+    # the process pool: wall-clock approaches the longest single file
+    # instead of the sum of all of them
+    with _render_pool(len(input_files)) as render_pool, Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        BarColumn(),
+        TaskProgressColumn(),
+        console=console,
+        transient=False
+    ) as progress:
+        task = progress.add_task("[cyan]Generating presentations...", total=len(input_files))
+
+        if _files_pack_small(input_files):
+            # Small files share LLM calls in groups of
+            # BATCH_LLM_GROUP_SIZE, cutting round trips and repeated
+            # instruction tokens
+            pairs = _packed_batch_pairs(
+                input_files, theme, provider, export_format,
+                use_cache, cache_ttl, progress, task, render_pool
+            )
+        else:
+
+            def process(input_file: str) -> str:
+                try:
+                    return _process_batch_file(
+                        input_file, theme, provider, export_format,
+                        use_cache, cache_ttl, render_pool
+                    )
+                finally:
+                    progress.advance(task)
+
+            pairs = run_batch_sync(input_files, process, concurrency=max_concurrent)
+
+    for input_file, result in pairs:
+        name = Path(input_file).name
+        if isinstance(result, Exception):
+            console.print(f"[red]❌ {name}: {result}[/red]")
+            results['failed'].append((input_file, str(result)))
+        else:
+            console.print(f"[green]✓ {name} → {result}[/green]")
             results['success'].append(input_file)
-        except Exception as e:
-            console.print(f"[red]❌ Failed: {e}[/red]")
-            results['failed'].append((input_file, str(e)))
-        
-        console.print()
-    
+
+    console.print()
+
     # Summary
     console.print(Panel(
         f"[bold]Completed:[/bold] {len(results['success'])}\n"
@@ -332,6 +576,8 @@ def run_batch_generation(
 
 def create_parser() -> argparse.ArgumentParser:
     """Create and configure argument parser."""
+    from llm_providers import get_available_providers
+
     parser = argparse.ArgumentParser(
         prog='pptgen',
         description=f'{APP_NAME} - Transform documents into stunning presentations using AI',
@@ -343,6 +589,8 @@ def create_parser() -> argparse.ArgumentParser:
   %(prog)s file1.txt file2.pdf --batch     # Batch processing
   %(prog)s doc.pdf --provider openai       # Use OpenAI GPT-4
   %(prog)s doc.pdf --export pdf            # Export to PDF
+  %(prog)s doc.pdf --theme minimal         # Re-theme; reuses cached LLM response
+  %(prog)s doc.pdf --invalidate-cache      # Force a fresh LLM call
   %(prog)s --interactive                   # Interactive mode
   %(prog)s --formats                       # Show supported formats
   %(prog)s --themes                        # Show available themes
@@ -364,7 +612,7 @@ def create_parser() -> argparse.ArgumentParser:
     
     parser.add_argument(
         '-t', '--theme',
-        choices=list(THEMES.keys()),
+        choices=_THEME_KEYS,
         default='professional',
         help='Presentation theme (default: professional)'
     )
@@ -424,75 +672,33 @@ def create_parser() -> argparse.ArgumentParser:
         help='Minimal output (no banner/progress)'
     )
     
-    return parser
-    
-    parser.add_argument(
-        '-t', '--theme',
-        choices=list(THEMES.keys()),
-        default='professional',
-        help='Presentation theme (default: professional)'
-    )
-    
-    parser.add_argument(
-        '-p', '--provider',
-        choices=list(get_available_providers().keys()),
-        default=DEFAULT_LLM_PROVIDER,
-        help=f'LLM provider to use (default: {DEFAULT_LLM_PROVIDER})'
-    )
-    
-    parser.add_argument(
-        '-e', '--export',
-        choices=EXPORT_FORMATS,
-        help='Export to additional format (pdf, html)'
-    )
-    
-    parser.add_argument(
-        '-b', '--batch',
-        action='store_true',
-        help='Process multiple files in batch mode'
-    )
-    
-    parser.add_argument(
-        '-i', '--interactive',
-        action='store_true',
-        help='Run in interactive mode with prompts'
-    )
-    
-    parser.add_argument(
-        '--formats',
-        action='store_true',
-        help='Show supported file formats'
-    )
-    
+
     parser.add_argument(
-        '--themes',
+        '--no-cache',
         action='store_true',
-        help='Show available presentation themes'
+        help='Bypass the on-disk LLM response cache'
     )
-    
-    parser.add_argument(
-        '--providers',
-        action='store_true',
-        help='Show available LLM providers'
-    )
-    
+
     parser.add_argument(
-        '-v', '--version',
-        action='version',
-        version=f'%(prog)s {APP_VERSION}'
+        '--cache-ttl',
+        type=float,
+        metavar='SECONDS',
+        help='Maximum age for cached LLM responses in seconds (default: no limit)'
     )
-    
+
     parser.add_argument(
-        '-q', '--quiet',
+        '--invalidate-cache',
         action='store_true',
-        help='Minimal output (no banner/progress)'
+        help='Re-issue the LLM call and overwrite the cached response'
     )
-    
+
     return parser
 
 
 def main():
     """Main function to orchestrate the presentation generation."""
+    from llm_providers import warm_up
+
     parser = create_parser()
     args = parser.parse_args()
     
@@ -543,58 +749,51 @@ def main():
         if not valid_files:
             console.print("[bold red]❌ Error:[/bold red] No valid files to process")
             sys.exit(1)
-        
+
+        # Open the provider connection while the banner prints
+        threading.Thread(target=warm_up, args=(args.provider,), daemon=True).start()
+
         if not args.quiet:
             show_banner()
             console.print()
         
-        run_batch_generation(valid_files, args.theme, args.provider, args.export)
+        run_batch_generation(
+            valid_files, args.theme, args.provider, args.export,
+            use_cache=not args.no_cache, cache_ttl=args.cache_ttl
+        )
         return
     
     # Single file mode
     input_file = args.input_file[0] if isinstance(args.input_file, list) else args.input_file
-    
-    # Validate input file
-    input_path = Path(input_file)
-    if not input_path.exists():
-        console.print(f"[bold red]❌ Error:[/bold red] File not found: {input_file}")
-        sys.exit(1)
-    
-    ext = input_path.suffix.lower()
-    if ext not in SUPPORTED_EXTENSIONS:
-        console.print(f"[bold red]❌ Error:[/bold red] Unsupported file type: {ext}")
-        console.print("[dim]Use --formats to see supported file types[/dim]")
-        sys.exit(1)
-    
-    # Show banner (unless quiet mode)
-    if not args.quiet:
-        show_banner()
-        console.print()
-    
-    # Run generation
-    output_file = args.output_file or get_output_path(input_file)
-    run_generation(input_file, output_file, args.theme, args.provider, args.export)
-    
+
     # Validate input file
     input_path = Path(input_file)
     if not input_path.exists():
         console.print(f"[bold red]❌ Error:[/bold red] File not found: {input_file}")
         sys.exit(1)
-    
+
     ext = input_path.suffix.lower()
     if ext not in SUPPORTED_EXTENSIONS:
         console.print(f"[bold red]❌ Error:[/bold red] Unsupported file type: {ext}")
         console.print("[dim]Use --formats to see supported file types[/dim]")
         sys.exit(1)
-    
+
+    # Open the provider connection while the banner prints; the
+    # first real request then reuses the warm pooled connection
+    threading.Thread(target=warm_up, args=(args.provider,), daemon=True).start()
+
     # Show banner (unless quiet mode)
     if not args.quiet:
         show_banner()
         console.print()
-    
+
     # Run generation
     output_file = args.output_file or get_output_path(input_file)
-    run_generation(input_file, output_file, args.theme, args.provider, args.export)
+    run_generation(
+        input_file, output_file, args.theme, args.provider, args.export,
+        use_cache=not args.no_cache, cache_ttl=args.cache_ttl,
+        refresh=args.invalidate_cache
+    )
 
 
 if __name__ == "__main__":
@@ -1,78 +1,354 @@
 """Module for generating professional PowerPoint presentations."""
 
-from typing import Dict, List, Any
+import io
+import os
+import re
+import threading
+import zipfile
+from collections import namedtuple
+from contextlib import contextmanager
+from copy import deepcopy
+from functools import lru_cache
+from typing import Dict, List, Any, Optional
 
 from pptx import Presentation
-from pptx.util import Inches, Pt
-from pptx.dml.color import RGBColor
+from pptx.opc import serialized as _opc_serialized
+from pptx.opc.packuri import PackURI
+from pptx.oxml.ns import qn
+from pptx.util import Inches, Pt, lazyproperty
 from pptx.enum.text import PP_ALIGN
 
 from config import (
-    THEMES, 
-    DEFAULT_SLIDE_WIDTH, 
+    THEMES,
+    DEFAULT_SLIDE_WIDTH,
     DEFAULT_SLIDE_HEIGHT,
     APP_NAME
 )
 
+# Length values are immutable, so the handful of sizes a deck actually
+# uses can be converted to EMU once and shared across every paragraph
+# instead of allocating a fresh Pt()/Inches() per call
+_pt = lru_cache(maxsize=64)(Pt)
+_SPACE_BEFORE = Pt(6)
+_SPACE_AFTER = Pt(4)
+_SLIDE_WIDTH = Inches(DEFAULT_SLIDE_WIDTH)
+_SLIDE_HEIGHT = Inches(DEFAULT_SLIDE_HEIGHT)
 
-def rgb_color(rgb_tuple: tuple) -> RGBColor:
-    """Convert RGB tuple to RGBColor object."""
-    return RGBColor(rgb_tuple[0], rgb_tuple[1], rgb_tuple[2])
+# Fallback for unknown theme names, resolved once at import
+_DEFAULT_THEME = THEMES['professional']
+
+# Matches any run of bullet/indent markers at the start of a point, so
+# the whole prefix comes off in one C-level scan
+_BULLET_PREFIX_RE = re.compile(r'(?:  |\t|- |• |\* )+')
+
+
+@lru_cache(maxsize=1)
+def _template_bytes() -> bytes:
+    """Read the default .pptx template once and keep it in memory."""
+    import pptx
+
+    path = os.path.join(os.path.dirname(pptx.__file__), 'templates', 'default.pptx')
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+def _new_presentation() -> Presentation:
+    """Fresh presentation from the in-memory default template.
+
+    Presentation() re-reads the template file from disk per call;
+    serving the cached bytes skips that read for every deck in a
+    batch. If the template cannot be located (packaging layout
+    changed), fall back to the stock constructor.
+    """
+    try:
+        data = _template_bytes()
+    except OSError:
+        return Presentation()
+    return Presentation(io.BytesIO(data))
+
+
+# python-pptx hardwires its zip writer, so tuning compression means
+# patching the writer class; the lock keeps concurrent saves from
+# seeing each other's patch
+_SAVE_PATCH_LOCK = threading.Lock()
+
+
+@contextmanager
+def _zip_compression(level: int):
+    """Temporarily save packages with the given zip compression level.
+
+    Level 0 stores entries uncompressed; 1-9 select the zlib effort.
+    Deflate is the dominant CPU cost of saving a text-only deck, so
+    callers that post-process or re-save the file can trade size for
+    speed.
+    """
+    if level == 0:
+        kwargs = {'compression': zipfile.ZIP_STORED}
+    else:
+        kwargs = {'compression': zipfile.ZIP_DEFLATED, 'compresslevel': level}
+
+    @lazyproperty
+    def _zipf(self) -> zipfile.ZipFile:
+        return zipfile.ZipFile(self._pkg_file, 'w', strict_timestamps=False, **kwargs)
+
+    with _SAVE_PATCH_LOCK:
+        original = _opc_serialized._ZipPkgWriter._zipf
+        _opc_serialized._ZipPkgWriter._zipf = _zipf
+        try:
+            yield
+        finally:
+            _opc_serialized._ZipPkgWriter._zipf = original
+
+
+def _fast_partnames(prs: Presentation) -> None:
+    """Make part-number allocation O(1) for the life of this deck.
+
+    The stock Package.next_partname rescans every part in the package
+    on each call to find a free number, which goes quadratic as slides
+    are added. generate_pptx only ever adds parts to a fresh package,
+    so the next free number per template is simply the last one handed
+    out plus one; the counter seeds itself from the stock scan on
+    first use of each template.
+    """
+    package = prs.part.package
+    original = package.next_partname
+    counters = {}
+
+    def next_partname(tmpl: str) -> PackURI:
+        n = counters.get(tmpl)
+        if n is None:
+            uri = original(tmpl)
+            counters[tmpl] = uri.idx + 1
+            return uri
+        counters[tmpl] = n + 1
+        return PackURI(tmpl % n)
+
+    package.next_partname = next_partname
+
+
+def get_layout(prs: Presentation, idx: int):
+    """Return prs.slide_layouts[idx], cached per presentation.
+
+    prs.slide_layouts rebuilds its wrapper objects on every access, so
+    the resolved layouts are stashed on the presentation itself and die
+    with it.
+    """
+    cache = getattr(prs, '_layout_cache', None)
+    if cache is None:
+        cache = prs._layout_cache = {}
+    layout = cache.get(idx)
+    if layout is None:
+        layout = cache[idx] = prs.slide_layouts[idx]
+    return layout
+
+
+@lru_cache(maxsize=64)
+def _hex_color(rgb_tuple: tuple) -> str:
+    """Format an RGB tuple as the srgbClr hex string, cached per tuple."""
+    return '%02X%02X%02X' % tuple(rgb_tuple)
+
+
+# A deck uses a handful of (font, size, color, bold) combinations but
+# styles thousands of paragraphs; resolving each combination to a spec
+# once turns the per-paragraph work into a single element copy
+_FormatSpec = namedtuple('_FormatSpec', ('font_name', 'size', 'color', 'bold', 'defrpr'))
+
+_A_DEFRPR = qn('a:defRPr')
+
+
+def _defrpr_element(font_size: int, color: tuple, font_name: str, bold: bool):
+    """Build the <a:defRPr> subtree the property chain would produce.
+
+    Setting font name/size/color/bold through paragraph.font walks
+    several descriptors, each doing a get-or-create subelement search;
+    building the finished subtree once per spec lets _apply_spec attach
+    it with a single copy-and-append.
+    """
+    from lxml import etree
+
+    defrpr = etree.SubElement(
+        etree.Element('root', nsmap={'a': 'http://schemas.openxmlformats.org/drawingml/2006/main'}),
+        _A_DEFRPR
+    )
+    defrpr.set('sz', str(font_size * 100))
+    defrpr.set('b', '1' if bold else '0')
+    fill = etree.SubElement(defrpr, qn('a:solidFill'))
+    etree.SubElement(fill, qn('a:srgbClr')).set('val', _hex_color(color))
+    etree.SubElement(defrpr, qn('a:latin')).set('typeface', font_name)
+    return defrpr
+
+
+@lru_cache(maxsize=128)
+def _format_spec(font_name: str, font_size: int, color: tuple, bold: bool = False) -> _FormatSpec:
+    """Resolve a styling combination to pre-converted font attributes."""
+    return _FormatSpec(
+        font_name, _pt(font_size), _hex_color(color), bold,
+        _defrpr_element(font_size, color, font_name, bold)
+    )
+
+
+def _apply_spec(paragraph, spec: _FormatSpec) -> None:
+    """Write a resolved spec onto a paragraph's font."""
+    pPr = paragraph._p.get_or_add_pPr()
+    existing = pPr.find(_A_DEFRPR)
+    if existing is not None:
+        pPr.remove(existing)
+    pPr.append(deepcopy(spec.defrpr))
 
 
 def apply_text_formatting(
-    paragraph, 
-    font_name: str, 
-    font_size: int, 
+    paragraph,
+    font_name: str,
+    font_size: int,
     color: tuple,
     bold: bool = False
 ) -> None:
     """Apply consistent text formatting to a paragraph."""
-    paragraph.font.name = font_name
-    paragraph.font.size = Pt(font_size)
-    paragraph.font.color.rgb = rgb_color(color)
-    paragraph.font.bold = bold
+    _apply_spec(paragraph, _format_spec(font_name, font_size, color, bold))
 
 
-def create_title_slide(
-    prs: Presentation, 
-    title: str, 
-    subtitle: str = "",
-    theme: Dict[str, Any] = None
+_A_R = qn('a:r')
+_A_T = qn('a:t')
+
+
+def _paragraph_template(paragraph):
+    """Return the paragraph's <a:p> element if it is clone-safe.
+
+    Each text_frame.add_paragraph() pays XML element creation,
+    namespace resolution, and proxy wrapping inside python-pptx. Once
+    one paragraph of a style tier exists, identically styled siblings
+    can be stamped out by deep-copying its lxml element and swapping
+    the text — bypassing the proxy layers entirely. Only single-run
+    paragraphs qualify; multi-run ones (embedded line breaks) fall
+    back to the proxy path.
+    """
+    p_elm = paragraph._p
+    runs = p_elm.findall(_A_R)
+    if len(runs) == 1:
+        return p_elm
+    return None
+
+
+def _append_cloned_paragraph(tx_body, template, text) -> None:
+    """Append a copy of a styled <a:p> template with new run text."""
+    p_elm = deepcopy(template)
+    p_elm.find(_A_R).find(_A_T).text = text
+    tx_body.append(p_elm)
+
+
+def _clone_safe(text: str) -> bool:
+    """True when assigning text to a single run reproduces p.text."""
+    return '\n' not in text and '\x0b' not in text
+
+
+def _style_title(shape, text: str, spec: _FormatSpec, center: bool = False) -> None:
+    """Set a title/subtitle shape's text and style its paragraph.
+
+    Assigning .text leaves exactly one paragraph, so indexing
+    paragraphs[0] styles it without the full lxml walk that iterating
+    the paragraphs property costs.
+    """
+    shape.text = text
+    paragraph = shape.text_frame.paragraphs[0]
+    _apply_spec(paragraph, spec)
+    if center:
+        paragraph.alignment = PP_ALIGN.CENTER
+
+
+# Every style a deck can use, resolved once per theme. The create_*
+# helpers read plain attributes off this table instead of walking the
+# theme dict and re-deriving sizes and colors per slide.
+_StyleTable = namedtuple('_StyleTable', (
+    'title', 'subtitle', 'content_title', 'section_title', 'thank_you_title',
+    'bullet', 'column_heading', 'column_body'
+))
+
+
+@lru_cache(maxsize=None)
+def _style_table(theme_name: str) -> _StyleTable:
+    """Resolve the full style set for a theme; unknown names fall back
+    to the professional theme, matching THEMES.get in generate_pptx."""
+    theme = THEMES.get(theme_name) or _DEFAULT_THEME
+    colors = theme['colors']
+    font_title = theme['font_title']
+    font_body = theme['font_body']
+    return _StyleTable(
+        title=_format_spec(font_title, theme['title_size'], colors['primary'], True),
+        subtitle=_format_spec(font_body, theme['subtitle_size'], colors['secondary']),
+        content_title=_format_spec(font_title, 36, colors['primary'], True),
+        section_title=_format_spec(font_title, theme['title_size'], colors['accent'], True),
+        thank_you_title=_format_spec(font_title, theme['title_size'] + 4, colors['accent'], True),
+        bullet=tuple(
+            _format_spec(font_body, theme['bullet_size'] - 2 * level, colors['text'])
+            for level in range(3)
+        ),
+        column_heading=_format_spec(font_title, 20, colors['secondary'], True),
+        column_body=_format_spec(font_body, theme['bullet_size'], colors['text']),
+    )
+
+
+def _create_title_like_slide(
+    prs: Presentation,
+    title: str,
+    subtitle: str,
+    styles: _StyleTable,
+    title_spec: _FormatSpec,
+    default_subtitle: str = ""
 ) -> None:
-    """Create a professional title slide."""
-    slide_layout = prs.slide_layouts[0]
+    """Shared builder for the title and thank-you slides.
+
+    The two differ only in title spec and subtitle default; one body
+    also means one hot call site for the interpreter to specialize.
+    """
+    slide_layout = get_layout(prs, 0)
     slide = prs.slides.add_slide(slide_layout)
-    
-    colors = theme['colors']
-    
+
     # Set title
-    title_shape = slide.shapes.title
-    title_shape.text = title
-    
-    for paragraph in title_shape.text_frame.paragraphs:
-        apply_text_formatting(
-            paragraph,
-            theme['font_title'],
-            theme['title_size'],
-            colors['primary'],
-            bold=True
-        )
-        paragraph.alignment = PP_ALIGN.CENTER
-    
-    # Set subtitle
-    if len(slide.placeholders) > 1:
+    _style_title(slide.shapes.title, title, title_spec, center=True)
+
+    # Set subtitle; indexing skips materializing the whole collection
+    # when only one placeholder is wanted
+    try:
         subtitle_shape = slide.placeholders[1]
-        subtitle_shape.text = subtitle
-        
-        for paragraph in subtitle_shape.text_frame.paragraphs:
-            apply_text_formatting(
-                paragraph,
-                theme['font_body'],
-                theme['subtitle_size'],
-                colors['secondary']
-            )
-            paragraph.alignment = PP_ALIGN.CENTER
+    except KeyError:
+        subtitle_shape = None
+    if subtitle_shape is not None:
+        _style_title(
+            subtitle_shape, subtitle or default_subtitle,
+            styles.subtitle, center=True
+        )
+
+
+def create_title_slide(
+    prs: Presentation,
+    title: str,
+    subtitle: str = "",
+    styles: _StyleTable = None
+) -> None:
+    """Create a professional title slide."""
+    _create_title_like_slide(prs, title, subtitle, styles, styles.title)
+
+
+def _classify_bullets(points: List[str]) -> List[tuple]:
+    """Strip indent prefixes and resolve levels for a slide's bullets.
+
+    Returns (text, level) pairs. Kept free of pptx objects so the whole
+    classification pass runs as a tight loop over plain strings before
+    any proxy work starts.
+    """
+    classified = []
+    for point in points:
+        level = 0
+        clean_point = point.strip()
+
+        # Detect sub-bullets: indent markers in the prefix set the level
+        match = _BULLET_PREFIX_RE.match(clean_point)
+        if match:
+            prefix = match.group()
+            level = min(prefix.count('  ') + prefix.count('\t'), 2)
+            clean_point = clean_point[match.end():]
+        classified.append((clean_point, level))
+    return classified
 
 
 def create_content_slide(
@@ -80,63 +356,45 @@ def create_content_slide(
     title: str, 
     bullet_points: List[str], 
     notes: str = "",
-    theme: Dict[str, Any] = None
+    styles: _StyleTable = None
 ) -> None:
     """Create a content slide with styled bullet points."""
-    slide_layout = prs.slide_layouts[1]
+    slide_layout = get_layout(prs, 1)
     slide = prs.slides.add_slide(slide_layout)
-    
-    colors = theme['colors']
-    
-    # Set title with styling
-    title_shape = slide.shapes.title
-    title_shape.text = title
-    
-    for paragraph in title_shape.text_frame.paragraphs:
-        apply_text_formatting(
-            paragraph,
-            theme['font_title'],
-            36,  # Slightly smaller for content slides
-            colors['primary'],
-            bold=True
-        )
-    
+
+    # Set title with styling (slightly smaller for content slides)
+    _style_title(slide.shapes.title, title, styles.content_title)
+
     # Set content with bullet points
     content_shape = slide.placeholders[1]
     text_frame = content_shape.text_frame
     text_frame.word_wrap = True
-    
-    for i, point in enumerate(bullet_points):
-        if i == 0:
-            p = text_frame.paragraphs[0]
-        else:
-            p = text_frame.add_paragraph()
-        
-        # Handle nested points (prefixed with "-" or "*" or indented)
-        level = 0
-        clean_point = point.strip()
-        
-        # Detect sub-bullets
-        while clean_point.startswith(('  ', '\t', '- ', '• ', '* ')):
-            if clean_point.startswith(('  ', '\t')):
-                level = min(level + 1, 2)
-                clean_point = clean_point[2:] if clean_point.startswith('  ') else clean_point[1:]
-            else:
-                clean_point = clean_point[2:]
-        
+
+    # One precomputed spec per indent level
+    bullet_specs = styles.bullet
+
+    tx_body = text_frame._txBody
+    templates = {}  # indent level -> styled <a:p> element to clone
+
+    for i, (clean_point, level) in enumerate(_classify_bullets(bullet_points)):
+        # After the first bullet of a level, siblings are cloned at
+        # the lxml layer instead of rebuilt through the proxy stack
+        template = templates.get(level)
+        if i and template is not None and _clone_safe(clean_point):
+            _append_cloned_paragraph(tx_body, template, clean_point)
+            continue
+
+        p = text_frame.paragraphs[0] if i == 0 else text_frame.add_paragraph()
         p.text = clean_point
         p.level = level
-        
+
         # Apply formatting based on level
-        font_size = theme['bullet_size'] - (level * 2)
-        apply_text_formatting(
-            p,
-            theme['font_body'],
-            font_size,
-            colors['text']
-        )
-        p.space_before = Pt(6)
-        p.space_after = Pt(4)
+        _apply_spec(p, bullet_specs[level])
+        p.space_before = _SPACE_BEFORE
+        p.space_after = _SPACE_AFTER
+
+        if templates.get(level) is None:
+            templates[level] = _paragraph_template(p)
     
     # Add speaker notes
     if notes:
@@ -149,27 +407,14 @@ def create_section_slide(
     prs: Presentation, 
     title: str,
     subtitle: str = "",
-    theme: Dict[str, Any] = None
+    styles: _StyleTable = None
 ) -> None:
     """Create a section header/divider slide."""
-    slide_layout = prs.slide_layouts[2]
+    slide_layout = get_layout(prs, 2)
     slide = prs.slides.add_slide(slide_layout)
-    
-    colors = theme['colors']
-    
+
     # Set section title
-    title_shape = slide.shapes.title
-    title_shape.text = title
-    
-    for paragraph in title_shape.text_frame.paragraphs:
-        apply_text_formatting(
-            paragraph,
-            theme['font_title'],
-            theme['title_size'],
-            colors['accent'],
-            bold=True
-        )
-        paragraph.alignment = PP_ALIGN.CENTER
+    _style_title(slide.shapes.title, title, styles.section_title, center=True)
 
 
 def create_two_column_slide(
@@ -179,203 +424,160 @@ def create_two_column_slide(
     right_content: List[str],
     left_title: str = "",
     right_title: str = "",
-    theme: Dict[str, Any] = None
+    styles: _StyleTable = None
 ) -> None:
     """Create a two-column comparison slide."""
-    slide_layout = prs.slide_layouts[3]  # Two Content layout
+    slide_layout = get_layout(prs, 3)  # Two Content layout
     slide = prs.slides.add_slide(slide_layout)
-    
-    colors = theme['colors']
-    
+
     # Set main title
-    title_shape = slide.shapes.title
-    title_shape.text = title
-    
-    for paragraph in title_shape.text_frame.paragraphs:
-        apply_text_formatting(
-            paragraph,
-            theme['font_title'],
-            36,
-            colors['primary'],
-            bold=True
-        )
-    
-    # Find content placeholders
-    content_shapes = [s for s in slide.placeholders if s.placeholder_format.idx > 0]
-    
+    _style_title(slide.shapes.title, title, styles.content_title)
+
+    # The Two Content layout keeps its body placeholders at idx 1 and
+    # 2, so fetch them directly; scanning every placeholder and reading
+    # each XML-backed idx is the fallback for odd layouts
+    try:
+        content_shapes = (slide.placeholders[1], slide.placeholders[2])
+    except KeyError:
+        content_shapes = [s for s in slide.placeholders if s.placeholder_format.idx > 0]
+
     if len(content_shapes) >= 2:
-        # Left column
-        left_frame = content_shapes[0].text_frame
-        if left_title:
-            left_frame.paragraphs[0].text = left_title
-            apply_text_formatting(
-                left_frame.paragraphs[0],
-                theme['font_title'],
-                20,
-                colors['secondary'],
-                bold=True
-            )
-            for point in left_content:
-                p = left_frame.add_paragraph()
-                p.text = point
-                apply_text_formatting(p, theme['font_body'], theme['bullet_size'], colors['text'])
-        else:
-            for i, point in enumerate(left_content):
-                if i == 0:
-                    left_frame.paragraphs[0].text = point
-                    apply_text_formatting(
-                        left_frame.paragraphs[0],
-                        theme['font_body'],
-                        theme['bullet_size'],
-                        colors['text']
-                    )
-                else:
-                    p = left_frame.add_paragraph()
-                    p.text = point
-                    apply_text_formatting(p, theme['font_body'], theme['bullet_size'], colors['text'])
-        
-        # Right column
-        right_frame = content_shapes[1].text_frame
-        if right_title:
-            right_frame.paragraphs[0].text = right_title
-            apply_text_formatting(
-                right_frame.paragraphs[0],
-                theme['font_title'],
-                20,
-                colors['secondary'],
-                bold=True
-            )
-            for point in right_content:
-                p = right_frame.add_paragraph()
+        heading_spec = styles.column_heading
+        body_spec = styles.column_body
+
+        # All body bullets share one style, so after the first is built
+        # through the proxy stack its <a:p> element is cloned for the
+        # rest of both columns
+        body_template = None
+
+        for frame, column_title, column_content in (
+            (content_shapes[0].text_frame, left_title, left_content),
+            (content_shapes[1].text_frame, right_title, right_content),
+        ):
+            if column_title:
+                frame.paragraphs[0].text = column_title
+                _apply_spec(frame.paragraphs[0], heading_spec)
+                first_body_index = None
+            else:
+                first_body_index = 0
+
+            tx_body = frame._txBody
+            for i, point in enumerate(column_content):
+                if i != first_body_index and body_template is not None and _clone_safe(point):
+                    _append_cloned_paragraph(tx_body, body_template, point)
+                    continue
+
+                p = frame.paragraphs[0] if i == first_body_index else frame.add_paragraph()
                 p.text = point
-                apply_text_formatting(p, theme['font_body'], theme['bullet_size'], colors['text'])
-        else:
-            for i, point in enumerate(right_content):
-                if i == 0:
-                    right_frame.paragraphs[0].text = point
-                    apply_text_formatting(
-                        right_frame.paragraphs[0],
-                        theme['font_body'],
-                        theme['bullet_size'],
-                        colors['text']
-                    )
-                else:
-                    p = right_frame.add_paragraph()
-                    p.text = point
-                    apply_text_formatting(p, theme['font_body'], theme['bullet_size'], colors['text'])
+                _apply_spec(p, body_spec)
+
+                if body_template is None:
+                    body_template = _paragraph_template(p)
 
 
 def create_thank_you_slide(
     prs: Presentation,
     title: str = "Thank You",
     subtitle: str = "",
-    theme: Dict[str, Any] = None
+    styles: _StyleTable = None
 ) -> None:
     """Create a closing thank you slide."""
-    slide_layout = prs.slide_layouts[0]  # Title layout
-    slide = prs.slides.add_slide(slide_layout)
-    
-    colors = theme['colors']
-    
-    # Set title
-    title_shape = slide.shapes.title
-    title_shape.text = title
-    
-    for paragraph in title_shape.text_frame.paragraphs:
-        apply_text_formatting(
-            paragraph,
-            theme['font_title'],
-            theme['title_size'] + 4,
-            colors['accent'],
-            bold=True
-        )
-        paragraph.alignment = PP_ALIGN.CENTER
-    
-    # Set subtitle
-    if len(slide.placeholders) > 1:
-        subtitle_shape = slide.placeholders[1]
-        subtitle_shape.text = subtitle or "Questions & Discussion"
-        
-        for paragraph in subtitle_shape.text_frame.paragraphs:
-            apply_text_formatting(
-                paragraph,
-                theme['font_body'],
-                theme['subtitle_size'],
-                colors['secondary']
-            )
-            paragraph.alignment = PP_ALIGN.CENTER
+    _create_title_like_slide(
+        prs, title, subtitle, styles, styles.thank_you_title,
+        default_subtitle="Questions & Discussion"
+    )
+
+
+# Big decks mean thousands of cleaned slides; a slotted tuple per slide
+# beats a four-key dict on both footprint and field access
+_CleanedSlide = namedtuple('_CleanedSlide', ('title', 'content', 'notes', 'type'))
 
 
 def validate_presentation_data(data: Dict[str, Any]) -> Dict[str, Any]:
-    """Validate and clean presentation data."""
+    """Validate and clean presentation data.
+
+    On return data['slides'] holds _CleanedSlide records rather than
+    per-slide dicts.
+    """
     if not isinstance(data, dict):
         raise ValueError("Presentation data must be a dictionary")
-    
+
     # Ensure required fields
     if 'title' not in data or not data['title']:
         data['title'] = 'Untitled Presentation'
-    
-    if 'slides' not in data:
+
+    raw_slides = data.get('slides')
+    if not raw_slides:
         data['slides'] = []
-    
+        return data
+
     # Validate and clean slides
     cleaned_slides = []
-    for slide in data['slides']:
+    for slide in raw_slides:
         if not isinstance(slide, dict):
             continue
-            
-        cleaned_slide = {
-            'title': slide.get('title', 'Untitled Slide'),
-            'content': slide.get('content', []),
-            'notes': slide.get('notes', ''),
-            'type': slide.get('type', 'content'),  # content, section, comparison
-        }
-        
-        # Ensure content is a list
-        if isinstance(cleaned_slide['content'], str):
-            cleaned_slide['content'] = [cleaned_slide['content']]
-        
-        # Filter out empty content
-        cleaned_slide['content'] = [
-            c for c in cleaned_slide['content'] 
-            if c and str(c).strip()
+
+        content = slide.get('content', [])
+        if isinstance(content, str):
+            content = [content]
+
+        # Normalize and drop empties in one pass; items are usually
+        # strings already, so str() only runs on the stragglers
+        content = [
+            s for s in (c if isinstance(c, str) else str(c) for c in content if c)
+            if s.strip()
         ]
-        
-        if cleaned_slide['content'] or cleaned_slide['type'] == 'section':
-            cleaned_slides.append(cleaned_slide)
-    
+
+        slide_type = slide.get('type', 'content')  # content, section, comparison
+        if content or slide_type == 'section':
+            cleaned_slides.append(_CleanedSlide(
+                slide.get('title', 'Untitled Slide'),
+                content,
+                slide.get('notes', ''),
+                slide_type,
+            ))
+
     data['slides'] = cleaned_slides
     return data
 
 
 def generate_pptx(
-    presentation_data: Dict[str, Any], 
-    output_path: str,
-    theme_name: str = "professional"
-) -> str:
+    presentation_data: Dict[str, Any],
+    output_path: Any,
+    theme_name: str = "professional",
+    compression_level: Optional[int] = None
+) -> Any:
     """
     Generate a professional PowerPoint file from the presentation data.
-    
+
     Args:
         presentation_data: Dictionary containing title and slides.
-        output_path: Path where the PPTX file should be saved.
+        output_path: Path where the PPTX file should be saved, or an
+            open binary file-like object to write into directly — the
+            deck streams straight to it with no intermediate file.
         theme_name: Name of the theme to apply.
-        
+        compression_level: Zip compression for the output file; 0
+            stores entries uncompressed, 1-9 select the zlib effort,
+            None keeps the library default. Lower levels save faster
+            at the cost of a larger file.
+
     Returns:
-        The path to the generated PPTX file.
+        The path or file-like object the PPTX was written to.
     """
-    # Get theme configuration
-    theme = THEMES.get(theme_name, THEMES['professional'])
+    # Resolve every style the deck will use, once per theme
+    styles = _style_table(theme_name)
     
     # Validate data
     presentation_data = validate_presentation_data(presentation_data)
     
     # Create presentation
-    prs = Presentation()
-    
+    prs = _new_presentation()
+    _fast_partnames(prs)
+
+
     # Set slide dimensions (16:9 widescreen)
-    prs.slide_width = Inches(DEFAULT_SLIDE_WIDTH)
-    prs.slide_height = Inches(DEFAULT_SLIDE_HEIGHT)
+    prs.slide_width = _SLIDE_WIDTH
+    prs.slide_height = _SLIDE_HEIGHT
     
     # Get presentation metadata
     main_title = presentation_data.get('title', 'Untitled Presentation')
@@ -383,34 +585,77 @@ def generate_pptx(
     
     # Create title slide
     subtitle = f"Generated by {APP_NAME}"
-    create_title_slide(prs, main_title, subtitle, theme)
+    create_title_slide(prs, main_title, subtitle, styles)
     
-    # Create content slides
+    # Create content slides; slide order matters, so this stays one
+    # loop dispatching on the cleaned record's type
     for slide_data in slides:
-        slide_type = slide_data.get('type', 'content')
-        slide_title = slide_data.get('title', 'Untitled Slide')
-        content = slide_data.get('content', [])
-        notes = slide_data.get('notes', '')
-        
-        if slide_type == 'section':
-            create_section_slide(prs, slide_title, theme=theme)
-        elif slide_type == 'comparison' and 'left' in slide_data and 'right' in slide_data:
-            create_two_column_slide(
-                prs, 
-                slide_title,
-                slide_data.get('left', []),
-                slide_data.get('right', []),
-                slide_data.get('left_title', ''),
-                slide_data.get('right_title', ''),
-                theme=theme
-            )
+        if slide_data.type == 'section':
+            create_section_slide(prs, slide_data.title, styles=styles)
         else:
-            create_content_slide(prs, slide_title, content, notes, theme)
+            create_content_slide(
+                prs, slide_data.title,
+                slide_data.content,
+                slide_data.notes,
+                styles
+            )
     
     # Create thank you slide
-    create_thank_you_slide(prs, theme=theme)
+    create_thank_you_slide(prs, styles=styles)
     
     # Save the presentation
-    prs.save(output_path)
-    
+    if compression_level is None:
+        prs.save(output_path)
+    else:
+        with _zip_compression(compression_level):
+            prs.save(output_path)
+
     return output_path
+
+
+def _generate_one(args: tuple) -> str:
+    """Pool worker: unpack one (data, path, theme_name) job."""
+    data, path, theme_name = args
+    return generate_pptx(data, path, theme_name)
+
+
+def generate_pptx_batch(
+    data_list: List[Dict[str, Any]],
+    output_paths: List[str],
+    theme_name: str = "professional",
+    max_workers: int = None
+) -> List[str]:
+    """
+    Render many presentations across processes.
+
+    Deck construction is lxml serialization plus zip compression, all
+    GIL-bound, so a process pool scales throughput with cores where
+    threads cannot. Spawn (not fork) keeps workers clear of any state
+    in the calling process.
+
+    Args:
+        data_list: One presentation-data dictionary per deck.
+        output_paths: Matching output path for each deck.
+        theme_name: Theme applied to every deck.
+        max_workers: Pool size; defaults to the CPU count.
+
+    Returns:
+        The output paths, in input order.
+    """
+    if len(data_list) != len(output_paths):
+        raise ValueError("data_list and output_paths must be the same length")
+
+    # A pool is pure overhead for one deck
+    if len(data_list) < 2:
+        return [generate_pptx(d, p, theme_name) for d, p in zip(data_list, output_paths)]
+
+    import os
+    from concurrent.futures import ProcessPoolExecutor
+    from itertools import repeat
+    from multiprocessing import get_context
+
+    with ProcessPoolExecutor(
+        max_workers=min(len(data_list), max_workers or os.cpu_count() or 1),
+        mp_context=get_context("spawn")
+    ) as pool:
+        return list(pool.map(_generate_one, zip(data_list, output_paths, repeat(theme_name))))